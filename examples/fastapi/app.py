@@ -1,23 +1,28 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import json
 import os
 import time
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Annotated, Literal
+from typing import Annotated
 
-from sqler.models import StaleVersionError
+from pydantic import BaseModel
 
 from fastapi import APIRouter, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
-from .db import close_db, init_db
+from .db import close_db, init_db, is_on_disk, optimize_db
 from .errors import install_exception_handlers
 from .models import Address, Order, User
 from .schemas import (
     AddressCreate,
     AddressOut,
+    ListUsersParams,
     OkOut,
     OrderCreate,
     OrderOut,
@@ -25,9 +30,15 @@ from .schemas import (
     UserOut,
     UserPatch,
 )
+from .services.addresses import (
+    bump_address_generation,
+    clear_address_cache,
+    get_address_cached,
+)
 from .services.users import query_users
 from .utils import db_call as _db_call
 from .utils import etag as _etag
+from .utils import etag_cache as _etag_cache
 
 """
 FastAPI demo using SQLer safely from async routes (threadpool handoff).
@@ -36,6 +47,89 @@ English: Lifespan startup/shutdown, ETag/If-Match, and WAL-friendly patterns.
 日本語: lifespan での起動/終了、ETag/If-Match、WAL に配慮した実装例。
 """
 
+OPTIMIZE_INTERVAL_S = 15 * 60
+
+# Header names, pre-lowercased where Starlette compares case-insensitively.
+ETAG = "ETag"
+IF_MATCH = "if-match"
+IF_NONE_MATCH = "if-none-match"
+
+# Encode responses with msgspec, else orjson, when installed (optional dependencies);
+# both emit JSON bytes in a single C pass.
+# 日本語: msgspec / orjson がインストールされていればレスポンスのエンコードに使用します。
+try:
+    import msgspec
+
+    _encode_json = msgspec.json.encode
+except ImportError:  # pragma: no cover - depends on the environment
+    try:
+        import orjson
+
+        _encode_json = orjson.dumps
+    except ImportError:
+
+        def _encode_json(content) -> bytes:
+            return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class DefaultJSONResponse(JSONResponse):
+    """JSON response rendered with the fastest available encoder.
+
+    日本語: 利用可能な最速のエンコーダで描画する JSON レスポンス。
+    """
+
+    def render(self, content) -> bytes:
+        return _encode_json(content)
+
+
+def _fields(payload: BaseModel, *, exclude: frozenset[str] = frozenset()) -> dict:
+    """Return a validated payload's field values without ``model_dump()``.
+
+    Request schemas hold only flat scalars, so ``__dict__`` already equals the dump;
+    skipping it avoids the serializer call and its argument handling per request.
+
+    日本語: ``model_dump()`` を使わずに検証済みペイロードのフィールド値を返します。
+    """
+    return {k: v for k, v in payload.__dict__.items() if k not in exclude}
+
+
+def _row(schema: type[BaseModel], obj: BaseModel) -> dict:
+    """Pick ``schema``'s fields off an already-validated model as a plain dict.
+
+    Routes return it in a ``DefaultJSONResponse`` so FastAPI skips re-validating
+    and re-serializing through the ``response_model`` (kept for OpenAPI only).
+
+    日本語: 検証済みモデルからスキーマのフィールドだけを dict として取り出します。
+    """
+    return {k: getattr(obj, k) for k in schema.model_fields}
+
+
+STREAM_CHUNK_ROWS = 64
+
+
+async def _stream_json_array(schema: type[BaseModel], items: list[BaseModel]):
+    """Yield ``items`` as a JSON array, encoding ``STREAM_CHUNK_ROWS`` rows per chunk.
+
+    日本語: ``items`` を JSON 配列として、チャンクごとにエンコードしながら返します。
+    """
+    yield b"["
+    for start in range(0, len(items), STREAM_CHUNK_ROWS):
+        rows = items[start : start + STREAM_CHUNK_ROWS]
+        # one encoder call per chunk; drop the brackets of the encoded sub-list
+        chunk = _encode_json([_row(schema, obj) for obj in rows])[1:-1]
+        yield (b"," + chunk) if start else chunk
+    yield b"]"
+
+
+async def _optimize_periodically(interval: float = OPTIMIZE_INTERVAL_S) -> None:
+    """Run ``PRAGMA optimize`` every ``interval`` seconds until cancelled.
+
+    日本語: キャンセルされるまで ``interval`` 秒ごとに ``PRAGMA optimize`` を実行します。
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await _db_call(optimize_db)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -44,8 +138,15 @@ async def lifespan(app: FastAPI):
     日本語: デモ用 DB の初期化とクリーンアップを行います。
     """
     init_db(os.getenv("SQLER_DB_PATH"))
+    optimizer = asyncio.create_task(_optimize_periodically()) if is_on_disk() else None
     yield
+    if optimizer is not None:
+        optimizer.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await optimizer
     close_db()
+    clear_address_cache()
+    _etag_cache.clear()
 
 
 app = FastAPI(
@@ -53,6 +154,7 @@ app = FastAPI(
     version="1.0.0",
     summary="JSON-first micro-ORM on SQLite with WAL + optimistic locking",
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
 )
 
 app.add_middleware(
@@ -64,16 +166,21 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    """Attach a simple process-time header to every response.
+DEBUG = os.getenv("DEBUG") == "1"
 
-    日本語: 各レスポンスに処理時間ヘッダーを付与します。
-    """
-    start = time.perf_counter()
-    resp: Response = await call_next(request)
-    resp.headers["X-Process-Time"] = f"{(time.perf_counter() - start):.6f}s"
-    return resp
+if DEBUG:
+
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        """Attach a process-time header to every response (only when ``DEBUG=1``).
+
+        日本語: 各レスポンスに処理時間ヘッダーを付与します（``DEBUG=1`` のときのみ）。
+        """
+        start = time.perf_counter_ns()
+        resp: Response = await call_next(request)
+        elapsed = (time.perf_counter_ns() - start) / 1e9
+        resp.headers.raw.append((b"x-process-time", b"%.6fs" % elapsed))
+        return resp
 
 
 install_exception_handlers(app)
@@ -94,28 +201,30 @@ async def create_address(payload: AddressCreate):
 
     日本語: 住所ドキュメントを作成します。
     """
-    a = await _db_call(lambda: Address(**payload.model_dump()).save())
-    return AddressOut.model_validate(
-        a.model_dump() | {"_id": a._id, "_version": getattr(a, "_version", 0)}
-    )
+    a = await _db_call(lambda: Address(**_fields(payload)).save())
+    bump_address_generation()
+    return DefaultJSONResponse(_row(AddressOut, a), status_code=status.HTTP_201_CREATED)
 
 
 @router_addresses.get("/{address_id}", response_model=AddressOut)
-async def get_address(address_id: int, request: Request, response: Response):
+async def get_address(address_id: int, request: Request):
     """Get an address by id with ETag support (304 on If-None-Match).
 
     日本語: ETag 対応の id 取得（If-None-Match なら 304）。
     """
-    a = await _db_call(lambda: Address.from_id(address_id))
+    inm = request.headers.get(IF_NONE_MATCH)
+    if inm is not None and _etag_cache.get(("address", address_id)) == inm:
+        return Response(status_code=304, headers={ETAG: inm})
+    # taken before the read: a write that commits meanwhile voids this cache fill
+    gen = _etag_cache.generation(("address", address_id))
+    a = await _db_call(lambda: Address.from_id(address_id), read=True)
     if not a:
         raise HTTPException(status_code=404, detail="address not found")
-    etag = _etag(a._id, getattr(a, "_version", 0))
-    if request.headers.get("if-none-match") == etag:
-        return Response(status_code=304, headers={"ETag": etag})
-    response.headers["ETag"] = etag
-    return AddressOut.model_validate(
-        a.model_dump() | {"_id": a._id, "_version": getattr(a, "_version", 0)}
-    )
+    etag = _etag(a._id, a._version)
+    _etag_cache.set(("address", address_id), etag, gen=gen)
+    if inm == etag:
+        return Response(status_code=304, headers={ETAG: etag})
+    return DefaultJSONResponse(_row(AddressOut, a), headers={ETAG: etag})
 
 
 @router_users.post("", response_model=UserOut, status_code=status.HTTP_201_CREATED)
@@ -126,9 +235,9 @@ async def create_user(payload: UserCreate):
     """
 
     def _create():
-        u = User(**payload.model_dump(exclude={"address_id"}))
+        u = User(**_fields(payload, exclude=frozenset({"address_id"})))
         if payload.address_id is not None:
-            addr = Address.from_id(payload.address_id)
+            addr = get_address_cached(payload.address_id)
             if not addr:
                 raise HTTPException(status_code=404, detail="address not found")
             u.set_address(addr)
@@ -136,59 +245,56 @@ async def create_user(payload: UserCreate):
         return u
 
     u = await _db_call(_create)
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    return DefaultJSONResponse(_row(UserOut, u), status_code=status.HTTP_201_CREATED)
 
 
 @router_users.get("/{user_id}", response_model=UserOut)
-async def get_user(user_id: int, request: Request, response: Response):
+async def get_user(user_id: int, request: Request):
     """Get a user by id with ETag support.
 
     日本語: ETag 対応の id 取得。
     """
-    u = await _db_call(lambda: User.from_id(user_id))
+    inm = request.headers.get(IF_NONE_MATCH)
+    if inm is not None and _etag_cache.get(("users", user_id)) == inm:
+        return Response(status_code=304, headers={ETAG: inm})
+    # taken before the read: a write that commits meanwhile voids this cache fill
+    gen = _etag_cache.generation(("users", user_id))
+    u = await _db_call(lambda: User.from_id(user_id), read=True)
     if not u:
         raise HTTPException(status_code=404, detail="user not found")
-    etag = _etag(u._id, getattr(u, "_version", 0))
-    if request.headers.get("if-none-match") == etag:
-        return Response(status_code=304, headers={"ETag": etag})
-    response.headers["ETag"] = etag
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    etag = _etag(u._id, u._version)
+    _etag_cache.set(("users", user_id), etag, gen=gen)
+    if inm == etag:
+        return Response(status_code=304, headers={ETAG: etag})
+    return DefaultJSONResponse(_row(UserOut, u), headers={ETAG: etag})
 
 
 @router_users.get("", response_model=list[UserOut])
-async def list_users(
-    min_age: Annotated[int | None, Query(ge=0)] = None,
-    city: Annotated[str | None, Query()] = None,
-    q: Annotated[str | None, Query(description="substring match on name")] = None,
-    limit: Annotated[int, Query(ge=1, le=500)] = 50,
-    offset: Annotated[int, Query(ge=0)] = 0,
-    sort: Annotated[Literal["id", "name", "age"], Query()] = "age",
-    dir: Annotated[Literal["asc", "desc"], Query()] = "asc",
-    include: Annotated[str | None, Query(description="comma list: address,orders")] = None,
-):
+async def list_users(params: Annotated[ListUsersParams, Query()]):
     """List users with filters and pagination.
 
     日本語: フィルタとページング付きユーザ一覧。
     """
 
-    def _list():
-        users = query_users(min_age, city, q, limit, offset, sort, dir, include)
-        return [
-            UserOut.model_validate(
-                u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-            )
-            for u in users
-        ]
-
-    return await _db_call(_list)
+    users = await _db_call(
+        lambda: query_users(
+            params.min_age,
+            params.city,
+            params.q,
+            params.limit,
+            params.offset,
+            params.sort,
+            params.dir,
+            params.include,
+            params.after,
+        ),
+        read=True,
+    )
+    return StreamingResponse(_stream_json_array(UserOut, users), media_type="application/json")
 
 
 @router_users.patch("/{user_id}", response_model=UserOut)
-async def patch_user(user_id: int, patch: UserPatch, request: Request, response: Response):
+async def patch_user(user_id: int, patch: UserPatch, request: Request):
     """Apply a partial update with If-Match and optimistic locking.
 
     日本語: If-Match と楽観的ロックで部分更新。
@@ -198,16 +304,16 @@ async def patch_user(user_id: int, patch: UserPatch, request: Request, response:
         u = User.from_id(user_id)
         if not u:
             raise HTTPException(status_code=404, detail="user not found")
-        current_etag = _etag(u._id, getattr(u, "_version", 0))
-        if (if_match := request.headers.get("if-match")) and if_match != current_etag:
+        current_etag = _etag(u._id, u._version)
+        if (if_match := request.headers.get(IF_MATCH)) and if_match != current_etag:
             raise HTTPException(status_code=412, detail="If-Match precondition failed")
 
-        data = patch.model_dump(exclude_unset=True)
+        data = {k: patch.__dict__[k] for k in patch.model_fields_set}
         if "address_id" in data:
             if data["address_id"] is None:
                 u.address = None
             else:
-                addr = Address.from_id(data["address_id"])
+                addr = get_address_cached(data["address_id"])
                 if not addr:
                     raise HTTPException(status_code=404, detail="address not found")
                 u.set_address(addr)
@@ -216,18 +322,14 @@ async def patch_user(user_id: int, patch: UserPatch, request: Request, response:
         for k, v in data.items():
             setattr(u, k, v)
 
-        try:
-            u.save()
-        except StaleVersionError:
-            raise HTTPException(status_code=409, detail="version conflict")
-        return u
+        # StaleVersionError propagates to the global 409 handler (errors.py)
+        u.save()
+        # serialize once in the worker; save() already bumped u._version in place
+        return _row(UserOut, u), _etag(u._id, u._version)
 
-    u = await _db_call(_patch)
-    etag = _etag(u._id, getattr(u, "_version", 0))
-    response.headers["ETag"] = etag
-    return UserOut.model_validate(
-        u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
-    )
+    body, etag = await _db_call(_patch)
+    _etag_cache.pop(("users", user_id))
+    return DefaultJSONResponse(body, headers={ETAG: etag})
 
 
 @router_orders.post("", response_model=OrderOut, status_code=status.HTTP_201_CREATED)
@@ -236,10 +338,8 @@ async def create_order(payload: OrderCreate):
 
     日本語: 注文ドキュメントを作成します。
     """
-    o = await _db_call(lambda: Order(**payload.model_dump()).save())
-    return OrderOut.model_validate(
-        o.model_dump() | {"_id": o._id, "_version": getattr(o, "_version", 0)}
-    )
+    o = await _db_call(lambda: Order(**_fields(payload)).save())
+    return DefaultJSONResponse(_row(OrderOut, o), status_code=status.HTTP_201_CREATED)
 
 
 @router_users.post("/{user_id}/orders/{order_id}", response_model=OkOut)
@@ -258,7 +358,9 @@ async def attach_order(user_id: int, order_id: int):
         u.save()
         return {"ok": True}
 
-    return await _db_call(_attach)
+    res = await _db_call(_attach)
+    _etag_cache.pop(("users", user_id))
+    return res
 
 
 app.include_router(router_addresses)
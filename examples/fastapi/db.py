@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from sqler import SQLerDB
@@ -14,6 +17,43 @@ English: Create/close a process-wide SQLerDB and bind models.
 """
 
 _db: Optional[SQLerDB] = None
+# Dedicated SQLite workers: K readers (each keeps its own thread-local connection)
+# and a single writer thread, instead of Starlette's shared 40-thread pool.
+# 日本語: 専用ワーカー（読み取り K 本 + 書き込み 1 本）。
+_read_pool: Optional[ThreadPoolExecutor] = None
+_write_pool: Optional[ThreadPoolExecutor] = None
+# True once the users_fts index exists (needs an SQLite build with FTS5 + trigram).
+_fts_enabled = False
+
+# Tuned per-connection PRAGMAs for the on-disk demo DB. ``SQLerDB.on_disk`` already
+# enables WAL + synchronous=NORMAL; these are appended so every thread-local connection
+# opened later (threadpool workers) gets the same settings.
+# 日本語: オンディスク DB 用の PRAGMA。スレッドごとの接続にも適用されます。
+DISK_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA wal_autocheckpoint = 1000",
+)
+
+# Trigram FTS5 index over users.name, kept in sync by triggers, so ``q`` substring
+# search is an index lookup instead of a LIKE '%q%' scan of every document.
+# 日本語: users.name のトライグラム FTS5 インデックス（トリガーで同期）。
+USERS_FTS_DDL = (
+    "CREATE VIRTUAL TABLE users_fts USING fts5(name, tokenize='trigram')",
+    "CREATE TRIGGER users_fts_ai AFTER INSERT ON users BEGIN "
+    "INSERT INTO users_fts(rowid, name) VALUES (new._id, json_extract(new.data, '$.name')); "
+    "END",
+    "CREATE TRIGGER users_fts_au AFTER UPDATE OF data ON users BEGIN "
+    "UPDATE users_fts SET name = json_extract(new.data, '$.name') WHERE rowid = new._id; "
+    "END",
+    "CREATE TRIGGER users_fts_ad AFTER DELETE ON users BEGIN "
+    "DELETE FROM users_fts WHERE rowid = old._id; "
+    "END",
+    "INSERT INTO users_fts(rowid, name) SELECT _id, json_extract(data, '$.name') FROM users",
+)
 
 
 def init_db(path: str | None = None):
@@ -21,10 +61,14 @@ def init_db(path: str | None = None):
 
     日本語: グローバル DB を初期化します（path 指定でオンディスク、未指定でインメモリ）。
     """
-    global _db
+    global _db, _read_pool, _write_pool, _fts_enabled
     if _db is not None:
         return _db
-    _db = SQLerDB.on_disk(path) if path else SQLerDB.in_memory(shared=False)
+    if path:
+        _db = SQLerDB.on_disk(path)
+        _apply_disk_pragmas(_db)
+    else:
+        _db = SQLerDB.in_memory(shared=False)
 
     User.set_db(_db)
     Address.set_db(_db)
@@ -34,12 +78,95 @@ def init_db(path: str | None = None):
     User.ensure_index("address._id")
     Address.ensure_index("city")
     Order.ensure_index("total")
-    # Optional: improve sorting/search
-    # User.ensure_index("name")
-
+    # ORDER BY name LIMIT n walks this index instead of sorting a temp b-tree
+    User.ensure_index("name")
+    _fts_enabled = _ensure_users_fts(_db)
+
+    if path:
+        # in-memory DBs run inline on the event loop (see utils.db_call), no pools needed
+        _read_pool = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 4, thread_name_prefix="sqler-r"
+        )
+        _write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqler-w")
     return _db
 
 
+def _apply_disk_pragmas(db: SQLerDB) -> None:
+    """Apply the tuned PRAGMAs now and on every future connection.
+
+    日本語: 調整済み PRAGMA を現在および今後の接続に適用します。
+    """
+    adapter = db.adapter
+    for pragma in DISK_PRAGMAS:
+        if pragma not in adapter.pragmas:
+            adapter.pragmas.append(pragma)
+        adapter.execute(pragma)
+    adapter.commit()
+
+
+def _ensure_users_fts(db: SQLerDB) -> bool:
+    """Create and backfill ``users_fts`` on first run; False when FTS5 is unavailable.
+
+    日本語: 初回に ``users_fts`` を作成・投入します（FTS5 が無ければ False）。
+    """
+    adapter = db.adapter
+    exists = adapter.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'users_fts'"
+    ).fetchone()
+    if exists:
+        return True
+    try:
+        adapter.execute(USERS_FTS_DDL[0])
+    except sqlite3.OperationalError:
+        # SQLite built without FTS5 or the trigram tokenizer (< 3.34): fall back to LIKE
+        return False
+    for stmt in USERS_FTS_DDL[1:]:
+        adapter.execute(stmt)
+    adapter.commit()
+    return True
+
+
+def fts_enabled() -> bool:
+    """Return True when ``users_fts`` can serve name searches.
+
+    日本語: ``users_fts`` で名前検索できる場合に True を返します。
+    """
+    return _fts_enabled
+
+
+def optimize_db() -> None:
+    """Run ``PRAGMA optimize`` so the planner statistics stay fresh.
+
+    日本語: ``PRAGMA optimize`` を実行し、プランナ統計を最新に保ちます。
+    """
+    if _db is not None:
+        _db.adapter.execute("PRAGMA optimize")
+
+
+def is_on_disk() -> bool:
+    """Return True when the global DB is file-backed.
+
+    日本語: グローバル DB がファイルベースなら True を返します。
+    """
+    return _db is not None and ":memory:" not in _db.adapter.path
+
+
+def is_in_memory() -> bool:
+    """Return True when the global DB is initialized and in-memory.
+
+    日本語: グローバル DB が初期化済みかつインメモリなら True を返します。
+    """
+    return _db is not None and not is_on_disk()
+
+
+def get_executor(read: bool) -> Optional[ThreadPoolExecutor]:
+    """Return the reader or writer pool (None before ``init_db``).
+
+    日本語: 読み取り/書き込み用のプールを返します（``init_db`` 前は None）。
+    """
+    return _read_pool if read else _write_pool
+
+
 def get_db() -> SQLerDB:
     """Return the initialized DB or raise if not yet started.
 
@@ -55,7 +182,12 @@ def close_db() -> None:
 
     日本語: グローバル DB をクローズして解放します。
     """
-    global _db
+    global _db, _read_pool, _write_pool, _fts_enabled
+    for pool in (_read_pool, _write_pool):
+        if pool is not None:
+            pool.shutdown(wait=True)
+    _read_pool = _write_pool = None
+    _fts_enabled = False
     if _db is not None:
         _db.close()
         _db = None
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -68,6 +68,25 @@ class UserOut(BaseModel):
     orders: list[dict] = Field(default_factory=list)
 
 
+class ListUsersParams(BaseModel):
+    """Query parameters for listing users, validated as one model.
+
+    日本語: ユーザ一覧のクエリパラメータ（1 つのモデルとして検証）。
+    """
+
+    min_age: Optional[int] = Field(default=None, ge=0)
+    city: Optional[str] = None
+    q: Optional[str] = Field(default=None, description="substring match on name")
+    limit: int = Field(default=50, ge=1, le=500)
+    offset: int = Field(default=0, ge=0)
+    sort: Literal["id", "name", "age"] = "age"
+    dir: Literal["asc", "desc"] = "asc"
+    include: Optional[str] = Field(default=None, description="comma list: address,orders")
+    after: Optional[int] = Field(
+        default=None, ge=0, description="keyset cursor for sort=id: last _id seen"
+    )
+
+
 class OrderCreate(BaseModel):
     """Payload to create an Order.
 
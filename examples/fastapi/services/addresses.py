@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Optional
+
+from ..models import Address
+from ..utils import TTLCache
+
+# Short-lived cache for address lookups done while linking users; 1s caps staleness
+# to roughly one ETag revalidation round. Misses are never cached.
+_addr_cache = TTLCache(maxsize=1024, ttl=1.0)
+
+
+def get_address_cached(address_id: int) -> Optional[Address]:
+    """Return ``Address.from_id`` through a 1-second TTL cache.
+
+    日本語: 1 秒 TTL キャッシュ経由で ``Address.from_id`` を返します。
+    """
+    addr = _addr_cache.get(address_id)
+    if addr is None:
+        addr = Address.from_id(address_id)
+        if addr is not None:
+            _addr_cache.set(address_id, addr)
+    return addr
+
+
+def clear_address_cache() -> None:
+    """Forget every cached address (e.g. when the DB is closed).
+
+    日本語: キャッシュ済みの住所をすべて破棄します（DB クローズ時など）。
+    """
+    _addr_cache.clear()
+    bump_address_generation()
+
+
+# Picker options for the UI forms: (generation, fetched_at, rows). Addresses only
+# change through create routes, which bump the generation.
+_CHOICES_TTL_S = 5.0
+_choices_lock = threading.Lock()
+_choices: dict = {"gen": 0, "cached_gen": -1, "ts": 0.0, "rows": []}
+
+
+def address_choices(limit: int = 200) -> list[dict]:
+    """Return ``{_id, city, country}`` dicts for the first addresses by id (cached).
+
+    日本語: id 順の先頭住所を ``{_id, city, country}`` の辞書で返します（キャッシュ付き）。
+    """
+    now = time.monotonic()
+    with _choices_lock:
+        if _choices["cached_gen"] == _choices["gen"] and now - _choices["ts"] < _CHOICES_TTL_S:
+            return _choices["rows"]
+        gen = _choices["gen"]
+    addrs = Address.query().order_by("_id").limit(limit).all()
+    rows = [{"_id": a._id, "city": a.city, "country": a.country} for a in addrs]
+    with _choices_lock:
+        # a create that raced with this read leaves the entry stale-marked
+        if _choices["gen"] == gen:
+            _choices.update(cached_gen=gen, ts=now, rows=rows)
+    return rows
+
+
+def bump_address_generation() -> None:
+    """Invalidate cached picker options after an address is created.
+
+    日本語: 住所の作成後にピッカー用キャッシュを無効化します。
+    """
+    with _choices_lock:
+        _choices["gen"] += 1
@@ -1,10 +1,72 @@
 from __future__ import annotations
 
-from typing import Optional
+import json
+import operator
+from functools import reduce
+from typing import Optional, Sequence
 
+from sqler.query import SQLerExpression
 from sqler.query import SQLerField as F
 
-from ..models import User
+from ..db import fts_enabled
+from ..models import Address, Order, User
+
+INCLUDABLE = frozenset({"address", "orders"})
+# ``<name>:full`` forces a fresh fetch even when the embedded ref already has the data.
+FULL_SUFFIX = ":full"
+# Raw ``include`` query strings seen in practice, mapped straight to their parsed set.
+_INCLUDE_TABLE: dict[str | None, frozenset[str]] = {
+    None: frozenset(),
+    "": frozenset(),
+    "address": frozenset({"address"}),
+    "orders": frozenset({"orders"}),
+    "address,orders": INCLUDABLE,
+    "orders,address": INCLUDABLE,
+}
+
+# The trigram tokenizer cannot match fewer than three characters.
+FTS_MIN_CHARS = 3
+
+
+def _name_search(q: str) -> SQLerExpression:
+    """Substring match on name via ``users_fts`` when available, else ``LIKE``.
+
+    日本語: 名前の部分一致（``users_fts`` があれば使用、なければ ``LIKE``）。
+    """
+    if fts_enabled() and len(q) >= FTS_MIN_CHARS:
+        phrase = '"' + q.replace('"', '""') + '"'
+        return SQLerExpression(
+            "_id IN (SELECT rowid FROM users_fts WHERE users_fts MATCH ?)", [phrase]
+        )
+    return F("name").like(f"%{q}%")
+
+
+def parse_include(include: Optional[str]) -> frozenset[str]:
+    """Parse a comma list like ``"address,orders"`` into the known relation names.
+
+    ``:full`` suffixes (``"address:full"``) count as the plain name here.
+
+    日本語: ``"address,orders"`` のようなカンマ区切りを既知の関連名の集合に変換します。
+    """
+    hit = _INCLUDE_TABLE.get(include)
+    if hit is not None:
+        return hit
+    return frozenset(t.removesuffix(FULL_SUFFIX) for t in include.split(",")) & INCLUDABLE
+
+
+def full_includes(include: Optional[str]) -> frozenset[str]:
+    """Return the relation names requested as ``<name>:full``.
+
+    日本語: ``<name>:full`` として指定された関連名の集合を返します。
+    """
+    if not include or FULL_SUFFIX not in include:
+        return frozenset()
+    return (
+        frozenset(
+            t.removesuffix(FULL_SUFFIX) for t in include.split(",") if t.endswith(FULL_SUFFIX)
+        )
+        & INCLUDABLE
+    )
 
 
 def query_users(
@@ -16,25 +78,91 @@ def query_users(
     sort: str = "age",
     dir: str = "asc",
     include: Optional[str] = None,
+    after: Optional[int] = None,
+    fields: Optional[Sequence[str]] = None,
 ):
-    qs = User.query()
+    """Filter, sort and page users in SQL.
+
+    ``after`` is a keyset cursor for ``sort="id"``: rows continue past that ``_id``
+    (in the sort direction) and ``offset`` is ignored, so deep pages cost the same
+    as the first one.
+
+    With ``fields`` (and no ``include``) only those fields are fetched, as tuples,
+    skipping model construction for read-only list views.
+
+    日本語: SQL でフィルタ・ソート・ページングします。``after`` は ``sort="id"`` 用のキーセットカーソル。
+    """
+    # Collect predicates and AND them once. Absent filters are left out rather than
+    # bound to catch-all sentinels: "(? IS NULL OR age >= ?)" would stop SQLite from
+    # using the age index, and the handful of distinct SQL shapes fits the
+    # sqlite3 statement cache anyway.
+    preds = []
     if min_age is not None:
-        qs = qs.filter(F("age") >= min_age)
+        preds.append(F("age") >= min_age)
     if city:
-        qs = qs.filter(User.ref("address").field("city") == city)
+        preds.append(User.ref("address").field("city") == city)
     if q:
-        qs = qs.filter(F("name").like(f"%{q}%"))
-
+        preds.append(_name_search(q))
     desc = dir == "desc"
-    inc = set((include or "").split(",")) & {"address", "orders"}
-    qs = qs.resolve(bool(inc))
-
-    if sort in {"name", "age"}:
-        arr = qs.order_by(sort, desc).limit(limit + offset).all()
-        items = arr[offset : offset + limit]
-    else:
-        arr = qs.all()
-        arr.sort(key=lambda u: int(u._id or 0), reverse=desc)
-        items = arr[offset : offset + limit]
-
-    return items
+    if after is not None and sort == "id":
+        preds.append(SQLerExpression("_id < ?" if desc else "_id > ?", [after]))
+        offset = 0
+
+    qs = User.query()
+    if preds:
+        qs = qs.filter(reduce(operator.and_, preds))
+
+    qs = qs.resolve(bool(parse_include(include)))
+
+    # ordering and paging happen in SQLite; "_id" sorts on the rowid column directly
+    sort_col = "_id" if sort == "id" else sort
+    qs = qs.order_by(sort_col, desc).limit(limit).offset(offset)
+    if fields is not None and not parse_include(include):
+        return qs.values(*fields)
+    return qs.all()
+
+
+def load_user_detail(user_id: int, include: Optional[str] = None) -> Optional[dict]:
+    """Load one user as a template-ready dict, with included refs, in a single SELECT.
+
+    The address is LEFT JOINed on ``$.address._id`` and the orders are gathered with
+    ``json_group_array`` over ``json_each($.orders)`` (in ref order, missing rows
+    skipped), so no model instances or per-ref lookups are needed for the HTML view.
+    Refs that are not included, or whose row is gone, are left as-is. Refs that
+    already embed the displayed fields (``city`` / ``total``) are reused without a
+    lookup unless requested as ``address:full`` / ``orders:full``.
+
+    日本語: 1 回の SELECT で、含める参照ごとユーザを読み込みテンプレート用 dict を返します。
+    """
+    inc, full = parse_include(include), full_includes(include)
+    users, addrs, orders = User.__tablename__, Address.__tablename__, Order.__tablename__
+    cols = ["u._id", "u._version", "u.data"]
+    join = ""
+    if "address" in inc:
+        stale = "" if "address" in full else " AND json_extract(u.data, '$.address.city') IS NULL"
+        cols.append("json_set(a.data, '$._id', a._id, '$._version', a._version)")
+        join = f"LEFT JOIN {addrs} a ON a._id = json_extract(u.data, '$.address._id'){stale}"
+    if "orders" in inc:
+        embedded = "0" if "orders" in full else "json_extract(j.value, '$.total') IS NOT NULL"
+        cols.append(
+            "(SELECT json_group_array(json(x)) FROM ("
+            "SELECT CASE WHEN o._id IS NULL THEN j.value "
+            "ELSE json_set(o.data, '$._id', o._id, '$._version', o._version) END AS x "
+            f"FROM json_each(u.data, '$.orders') j LEFT JOIN {orders} o "
+            f"ON o._id = json_extract(j.value, '$._id') AND NOT ({embedded}) "
+            f"WHERE o._id IS NOT NULL OR {embedded} ORDER BY j.key))"
+        )
+    sql = f"SELECT {', '.join(cols)} FROM {users} u {join} WHERE u._id = ?"
+    row = User.db().adapter.execute(sql, [user_id]).fetchone()
+    if row is None:
+        return None
+    _id, version, data, *extra = row
+    user = json.loads(data)
+    user["_id"], user["_version"] = _id, version
+    if "address" in inc:
+        addr = extra.pop(0)
+        if addr is not None:
+            user["address"] = json.loads(addr)
+    if "orders" in inc:
+        user["orders"] = json.loads(extra.pop(0))
+    return user
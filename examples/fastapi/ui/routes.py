@@ -1,35 +1,134 @@
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from typing import Annotated, Literal
 
+from jinja2 import Template
 from sqler.query import SQLerField as F
 
 from fastapi import APIRouter, Form, HTTPException, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 
-from ..models import Address, Order, User
-from ..services.users import query_users
+from ..models import Address, User
+from ..services.addresses import address_choices, bump_address_generation
+from ..services.users import load_user_detail, parse_include, query_users
 from ..utils import db_call as _db_call
 from ..utils import etag as _etag
+from ..utils import etag_cache as _etag_cache
 
 router = APIRouter(prefix="/ui", tags=["UI"])
 
 TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
+# Back Jinja's ``tojson`` filter with orjson when installed (optional dependency);
+# Jinja still applies its HTML-safe escaping to the dumped string.
+# 日本語: orjson があれば Jinja の ``tojson`` フィルタで使用します。
+try:
+    import orjson
+
+    templates.env.policies["json.dumps_function"] = lambda obj: orjson.dumps(obj).decode()
+    templates.env.policies["json.dumps_kwargs"] = {}
+except ImportError:  # pragma: no cover - depends on the environment
+    templates.env.policies["json.dumps_kwargs"] = {"separators": (",", ":")}
+
+# Resolve templates once at import: handlers render these objects directly instead of
+# going through a name lookup (and, with auto_reload, a stat() of the file) per request.
+# Set DEBUG=1 to keep Jinja's reload-on-change for the extends/include chain.
+# 日本語: テンプレートは import 時に一度だけ解決し、各リクエストでは直接レンダリングします。
+templates.env.auto_reload = os.getenv("DEBUG") == "1"
+_T_HOME = templates.get_template("home.html")
+_T_USERS_INDEX = templates.get_template("users/index.html")
+_T_USERS_TABLE = templates.get_template("users/_table.html")
+_T_USER_DETAIL = templates.get_template("users/detail.html")
+_T_USER_EDIT = templates.get_template("users/_edit_modal.html")
+_T_USER_PANEL = templates.get_template("users/_detail_panel.html")
+_T_TOAST = templates.get_template("partials/_toast.html")
+_T_ADDR_INDEX = templates.get_template("addresses/index.html")
+_T_ADDR_TABLE = templates.get_template("addresses/_table.html")
+
 Sort = Annotated[Literal["id", "name", "age"], Query()]
 Dir = Annotated[Literal["asc", "desc"], Query()]
 
 
+STREAM_FLUSH_CHARS = 16 * 1024
+
+
+def _render(
+    tpl: Template, ctx: dict, status_code: int = 200, headers: dict | None = None
+) -> HTMLResponse:
+    return HTMLResponse(tpl.render(ctx), status_code=status_code, headers=headers)
+
+
+async def _render_chunks(tpl: Template, ctx: dict):
+    # Jinja's generate() yields many tiny fragments; batch them so each socket write
+    # carries a useful payload, and stay on the loop (rendering plain dicts is cheap).
+    buf: list[str] = []
+    size = 0
+    for part in tpl.generate(ctx):
+        buf.append(part)
+        size += len(part)
+        if size >= STREAM_FLUSH_CHARS:
+            yield "".join(buf)
+            buf.clear()
+            size = 0
+    if buf:
+        yield "".join(buf)
+
+
+def _stream_template(tpl: Template, ctx: dict) -> StreamingResponse:
+    """Render a template incrementally instead of building the whole page first.
+
+    日本語: ページ全体を組み立てずに、テンプレートを逐次レンダリングして返す。
+    """
+    return StreamingResponse(_render_chunks(tpl, ctx), media_type="text/html")
+
+
+# Columns the users table partial renders; refs come back from SQLite as JSON text.
+TABLE_FIELDS = ("_id", "_version", "name", "age", "address", "orders")
+_JSON_FIELDS = frozenset({"address", "orders"})
+
+
+def _hx_vals(params: dict) -> dict:
+    # hx-vals payload for the initial table load; htmx would send None as "null"
+    return {k: "" if v is None else v for k, v in params.items()}
+
+
+def _pack_rows(rows: list[tuple]) -> list[dict]:
+    # Runs on the DB worker: zip projected tuples into row dicts, then fill in the
+    # address cities shown in the table with a single IN query.
+    packed = [
+        {
+            k: json.loads(v) if k in _JSON_FIELDS and v is not None else v
+            for k, v in zip(TABLE_FIELDS, r)
+        }
+        for r in rows
+    ]
+    ids = {int(d["address"]["_id"]) for d in packed if d["address"]}
+    addrs = {
+        a._id: {"_id": a._id, "city": a.city, "country": a.country} for a in Address.from_ids(ids)
+    }
+    for d in packed:
+        if d["address"]:
+            d["address"] = addrs.get(int(d["address"]["_id"]), d["address"])
+    return packed
+
+
 def _pack_user(u: User) -> dict:
-    return u.model_dump() | {"_id": u._id, "_version": getattr(u, "_version", 0)}
+    # Templates only read the result, so a shallow copy of the already-validated field
+    # values is enough; model_dump() would walk and deep-copy every field per row.
+    d = dict(u.__dict__)
+    d["_id"] = u._id
+    d["_version"] = u._version
+    return d
 
 
 @router.get("/", response_class=HTMLResponse)
 async def ui_home(request: Request):
-    return templates.TemplateResponse("home.html", {"request": request})
+    return _render(_T_HOME, {"request": request})
 
 
 @router.get("/users", response_class=HTMLResponse)
@@ -44,13 +143,8 @@ async def ui_users(
     dir: Dir = "asc",
     include: str | None = None,
 ):
-    # load addresses for the new-user form picker (top 100 by _id)
-    def _addresses():
-        addrs = Address.query().limit(200).all()
-        addrs.sort(key=lambda a: int(a._id or 0))
-        return addrs
-
-    addresses = await _db_call(_addresses)
+    # addresses for the new-user form picker (first 200 by _id, cached)
+    addresses = await _db_call(address_choices, read=True)
 
     ctx = {
         "request": request,
@@ -64,9 +158,10 @@ async def ui_users(
             "dir": dir,
             "include": include,
         },
-        "addresses": [{"_id": a._id, "city": a.city, "country": a.country} for a in addresses],
+        "addresses": addresses,
     }
-    return templates.TemplateResponse("users/index.html", ctx)
+    ctx["vals"] = _hx_vals(ctx["params"])
+    return _render(_T_USERS_INDEX, ctx)
 
 
 @router.get("/users/partial/table", response_class=HTMLResponse)
@@ -88,15 +183,30 @@ async def ui_users_table(
             min_age_int = int(min_age)
         except ValueError:
             min_age_int = None
-    users = await _db_call(
-        lambda: query_users(min_age_int, city or None, q or None, limit, offset, sort, dir, include)
-    )
-    users = [_pack_user(u) for u in users]
-    return templates.TemplateResponse(
-        "users/_table.html",
+    # without includes nothing needs hydrating, so skip the models and project columns
+    project = not parse_include(include)
+
+    def _load():
+        users = query_users(
+            min_age_int,
+            city or None,
+            q or None,
+            limit,
+            offset,
+            sort,
+            dir,
+            include,
+            fields=TABLE_FIELDS if project else None,
+        )
+        return _pack_rows(users) if project else users
+
+    users = await _db_call(_load, read=True)
+    rows = users if project else (_pack_user(u) for u in users)
+    return _stream_template(
+        _T_USERS_TABLE,
         {
             "request": request,
-            "users": users,
+            "users": rows,
             "params": {
                 "min_age": min_age,
                 "city": city,
@@ -113,32 +223,14 @@ async def ui_users_table(
 
 @router.get("/users/{user_id}", response_class=HTMLResponse)
 async def ui_user_detail(request: Request, user_id: int, include: str | None = "address,orders"):
-    def _load():
-        u = User.from_id(user_id)
-        if not u:
-            return None
-        inc = set((include or "").split(","))
-        if u.address and isinstance(u.address, dict) and "address" in inc:
-            addr = Address.from_id(int(u.address.get("_id")))
-            if addr:
-                u.address = _pack_user(addr)  # type: ignore[assignment]
-        if "orders" in inc:
-            resolved: list[dict] = []
-            for ref in u.orders or []:
-                oid = int(ref.get("_id"))
-                o = Order.from_id(oid)
-                if o:
-                    resolved.append(_pack_user(o))
-            u.orders = resolved  # type: ignore[assignment]
-        return u
-
-    u = await _db_call(_load)
-    if not u:
+    # user, address and orders come back from one statement as template-ready dicts
+    user = await _db_call(load_user_detail, user_id, include, read=True)
+    if user is None:
         raise HTTPException(status_code=404)
-    etag = _etag(u._id, getattr(u, "_version", 0))
-    return templates.TemplateResponse(
-        "users/detail.html",
-        {"request": request, "user": _pack_user(u), "etag": etag, "include": include},
+    etag = _etag(user["_id"], user["_version"])
+    return _render(
+        _T_USER_DETAIL,
+        {"request": request, "user": user, "etag": etag, "include": include},
         headers={"ETag": etag},
     )
 
@@ -149,16 +241,16 @@ async def ui_user_edit(request: Request, user_id: int):
         u = User.from_id(user_id)
         if not u:
             return None, None
-        etag = _etag(u._id, getattr(u, "_version", 0))
+        etag = _etag(u._id, u._version)
         addrs = Address.query().order_by("_id", False).limit(100).all()
         return u, etag, addrs
 
-    res = await _db_call(_load)
+    res = await _db_call(_load, read=True)
     if not res or res[0] is None:
         raise HTTPException(status_code=404)
     u, etag, addresses = res
-    return templates.TemplateResponse(
-        "users/_edit_modal.html",
+    return _render(
+        _T_USER_EDIT,
         {
             "request": request,
             "user": _pack_user(u),
@@ -212,7 +304,7 @@ async def ui_user_update(
         u = User.from_id(user_id)
         if not u:
             return None, None
-        current_etag = _etag(u._id, getattr(u, "_version", 0))
+        current_etag = _etag(u._id, u._version)
         if if_match != current_etag:
             return "precondition", None
         if name not in (None, ""):
@@ -224,26 +316,28 @@ async def ui_user_update(
             if addr:
                 u.set_address(addr)
         u.save()
-        return u, _etag(u._id, getattr(u, "_version", 0))
+        etag = _etag(u._id, u._version)
+        # resolve the address for display while still on the DB worker
+        if isinstance(u.address, dict) and u.address.get("_id") is not None:
+            addr = Address.from_id(int(u.address["_id"]))
+            if addr:
+                u.address = _pack_user(addr)  # type: ignore[assignment]
+        return u, etag
 
     res = await _db_call(_update)
-    if res is None:
+    _etag_cache.pop(("users", user_id))
+    if res[0] is None:
         raise HTTPException(status_code=404)
     if res[0] == "precondition":
-        return templates.TemplateResponse(
-            "partials/_toast.html",
+        return _render(
+            _T_TOAST,
             {"request": request, "kind": "error", "msg": "Precondition failed. Reload and retry."},
             status_code=412,
         )
     u, etag = res
-    # Resolve address for display after update
-    if isinstance(u.address, dict) and u.address.get("_id") is not None:
-        addr = Address.from_id(int(u.address["_id"]))
-        if addr:
-            u.address = _pack_user(addr)  # type: ignore[assignment]
     # Return only the detail panel partial and trigger modal close
-    return templates.TemplateResponse(
-        "users/_detail_panel.html",
+    return _render(
+        _T_USER_PANEL,
         {"request": request, "user": _pack_user(u), "etag": etag, "include": "address,orders"},
         headers={"ETag": etag, "HX-Trigger": "close-modal"},
     )
@@ -268,7 +362,8 @@ async def ui_addresses(
         "request": request,
         "params": {"q": q, "city": city, "country": country},
     }
-    return templates.TemplateResponse("addresses/index.html", ctx)
+    ctx["vals"] = _hx_vals(ctx["params"])
+    return _render(_T_ADDR_INDEX, ctx)
 
 
 @router.get("/addresses/partial/table", response_class=HTMLResponse)
@@ -290,13 +385,12 @@ async def ui_addresses_table(
         addrs.sort(key=lambda a: int(a._id or 0))
         return addrs
 
-    addresses = await _db_call(_list)
-    addresses = [{"_id": a._id, "city": a.city, "country": a.country} for a in addresses]
-    return templates.TemplateResponse(
-        "addresses/_table.html",
+    addresses = await _db_call(_list, read=True)
+    return _stream_template(
+        _T_ADDR_TABLE,
         {
             "request": request,
-            "addresses": addresses,
+            "addresses": ({"_id": a._id, "city": a.city, "country": a.country} for a in addresses),
             "params": {"q": q, "city": city, "country": country},
         },
     )
@@ -313,4 +407,5 @@ async def ui_addresses_create(
         a.save()
 
     await _db_call(_create)
+    bump_address_generation()
     return await ui_addresses_table(request, q=None, city=None, country=None)
@@ -1,22 +1,132 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Hashable
 
 from starlette.concurrency import run_in_threadpool
 
+from .db import get_executor, is_in_memory
 
+
+@functools.lru_cache(maxsize=8192)
 def etag(obj_id: int, version: int | None) -> str:
-    """Build a strong ETag from id and version.
+    """Build a strong ETag from id and version (memoized per pair).
 
-    日本語: id と _version 由来の強い ETag を組み立てる。
+    日本語: id と _version 由来の強い ETag を組み立てる（組ごとにキャッシュ）。
     """
-    v = 0 if version is None else int(version)
-    return f'"{obj_id}-{v}"'
+    # None and 0 both mean "never saved"; %d also accepts int subclasses without int()
+    return '"%d-%d"' % (obj_id, version or 0)
+
+
+# Writers are serialized in-process so concurrent PATCHes don't spin on SQLITE_BUSY;
+# readers use their own thread-local connection (see SQLiteAdapter) and never take it.
+# Only needed on the fallback path: the dedicated writer pool has a single thread.
+_write_lock = threading.Lock()
+
+
+def _with_write_lock(fn, *args: Any, **kwargs: Any):
+    with _write_lock:
+        return fn(*args, **kwargs)
+
 
+async def db_call(fn, *args: Any, read: bool = False, **kwargs: Any):
+    """Run a blocking function on the dedicated SQLite worker pools.
 
-async def db_call(fn, *args: Any, **kwargs: Any):
-    """Run a blocking function in the threadpool.
+    Reads (``read=True``) run concurrently on the reader pool, each worker on its
+    own thread-local connection; writes go to the single writer thread. Before
+    ``init_db`` has created the pools, fall back to Starlette's threadpool.
+    In-memory databases skip the handoff entirely: their queries take about a
+    microsecond, far less than a thread hop.
 
-    日本語: ブロッキング処理をスレッドプールで実行する。
+    日本語: 専用ワーカープールでブロッキング処理を実行する。読み取りは並行、書き込みは単一スレッド。
+    インメモリ DB はスレッド切り替えより速いため、イベントループ上で直接実行する。
     """
-    return await run_in_threadpool(fn, *args, **kwargs)
+    if is_in_memory():
+        return fn(*args, **kwargs)
+    pool = get_executor(read)
+    if pool is None:
+        if read:
+            return await run_in_threadpool(fn, *args, **kwargs)
+        return await run_in_threadpool(_with_write_lock, fn, *args, **kwargs)
+    call = functools.partial(fn, *args, **kwargs)
+    return await asyncio.get_running_loop().run_in_executor(pool, call)
+
+
+class TTLCache:
+    """Tiny thread-safe TTL cache for hot lookups (stores positive hits only).
+
+    日本語: スレッドセーフな小さな TTL キャッシュ（ヒットした値のみ保存）。
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 1.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: dict[Hashable, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+        # per-key invalidation counters (see ``generation``); keys never popped
+        # report ``_floor``, which moves past every counter when the map is reset
+        self._gens: dict[Hashable, int] = {}
+        self._counter = 0
+        self._floor = 0
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            hit = self._data.get(key)
+            if hit is None:
+                return None
+            expires, value = hit
+            if expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def generation(self, key: Hashable) -> int:
+        """Return the key's invalidation generation; read it before loading the value.
+
+        日本語: キーの無効化世代を返します（値を読み込む前に取得）。
+        """
+        with self._lock:
+            return self._gens.get(key, self._floor)
+
+    def set(self, key: Hashable, value: Any, gen: int | None = None) -> None:
+        """Store ``value``; with ``gen``, only if ``key`` was not popped since then.
+
+        A reader that loaded the value before a write committed would otherwise
+        put the stale value back after the writer's ``pop``.
+
+        日本語: ``gen`` 指定時は、その後に ``pop`` されていない場合のみ保存します。
+        """
+        with self._lock:
+            if gen is not None and gen != self._gens.get(key, self._floor):
+                return
+            if len(self._data) >= self.maxsize and key not in self._data:
+                # drop the oldest insertion (dicts preserve order)
+                self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._gens) >= self.maxsize:
+                # forget the counters; every generation read so far stops matching
+                self._gens.clear()
+                self._floor = self._counter + 1
+            self._counter += 1
+            self._gens[key] = self._counter
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._gens.clear()
+            self._counter += 1
+            self._floor = self._counter
+
+
+# (table, id) -> current ETag, so conditional GETs can answer 304 without touching
+# SQLite. Writers pop their key and readers fill it only for the generation they read
+# under; the 1s TTL bounds staleness from any other writer.
+# 日本語: (テーブル, id) -> 現在の ETag。条件付き GET は SQLite を介さず 304 を返せる。
+etag_cache = TTLCache(maxsize=8192, ttl=1.0)
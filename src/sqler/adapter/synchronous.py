@@ -5,6 +5,11 @@ from typing import Any, Optional, Self
 
 from .abstract import AdapterABC, NotConnectedError
 
+# Prepared statements kept per connection, keyed by SQL text. Query shapes are
+# parameterized (values are bound, ids go through json_each), so a few hundred
+# distinct strings cover an app; sqlite3's default of 128 can churn.
+STATEMENT_CACHE_SIZE = 512
+
 
 class SQLiteAdapter(AdapterABC):
     """Synchronous SQLite adapter with WAL and thread-local connections."""
@@ -31,7 +36,12 @@ class SQLiteAdapter(AdapterABC):
             raise NotConnectedError("Database not connected, call connect() first")
         if self._memory_singleton:
             if self._single_conn is None:
-                self._single_conn = sqlite3.connect(self.path, uri=True, check_same_thread=False)
+                self._single_conn = sqlite3.connect(
+                    self.path,
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=STATEMENT_CACHE_SIZE,
+                )
                 self._single_conn.row_factory = sqlite3.Row
                 cur = self._single_conn.cursor()
                 for pragma in self.pragmas:
@@ -41,7 +51,9 @@ class SQLiteAdapter(AdapterABC):
         conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
         if conn is not None:
             return conn
-        conn = sqlite3.connect(self.path, uri=True, check_same_thread=False)
+        conn = sqlite3.connect(
+            self.path, uri=True, check_same_thread=False, cached_statements=STATEMENT_CACHE_SIZE
+        )
         conn.row_factory = sqlite3.Row
         cur = conn.cursor()
         for pragma in self.pragmas:
@@ -104,6 +116,32 @@ class SQLiteAdapter(AdapterABC):
         conn.commit()
         return cursor
 
+    def begin(self, mode: str = "") -> None:
+        """Open an explicit transaction on this thread's connection.
+
+        Statements run until the next ``commit()`` (or the end of a ``with``
+        block) share it, so a batch of writes pays for a single commit.
+
+        A plain ``begin()`` inside an open transaction (including the implicit one
+        any uncommitted write starts) is a no-op and simply joins it.
+
+        Args:
+            mode: ``""``, ``"DEFERRED"``, ``"IMMEDIATE"`` or ``"EXCLUSIVE"``.
+                ``"IMMEDIATE"`` takes the write lock up front.
+
+        Raises:
+            sqlite3.OperationalError: If ``mode`` is given while a transaction is
+                already open, since its locking guarantee could not be honored.
+        """
+        conn = self._conn()
+        if conn.in_transaction:
+            if mode:
+                raise sqlite3.OperationalError(
+                    f"BEGIN {mode}: a transaction is already open; commit() first"
+                )
+            return
+        conn.execute(f"BEGIN {mode}".strip())
+
     def commit(self) -> None:
         """Commit the current transaction."""
         conn = self._conn()
@@ -119,7 +157,8 @@ class SQLiteAdapter(AdapterABC):
 
     def __exit__(self, exception_type, exception_value, exception_tracebak):
         """Exit context manager; commit or rollback depending on exceptions"""
-        conn = getattr(self._local, "conn", None)
+        # ":memory:" adapters keep their one connection outside the thread-local slot
+        conn = self._single_conn if self._memory_singleton else getattr(self._local, "conn", None)
         if conn is None:
             return
         if exception_type is None:
@@ -2,6 +2,7 @@ import json
 from typing import Any, Optional
 
 from sqler.adapter.asynchronous import AsyncSQLiteAdapter
+from sqler.db.sqler_db import _dumps
 
 
 class AsyncSQLerDB:
@@ -38,7 +39,7 @@ class AsyncSQLerDB:
 
     async def insert_document(self, table: str, doc: dict[str, Any]) -> int:
         await self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         cur = await self.adapter.execute(f"INSERT INTO {table} (data) VALUES (json(?));", [payload])
         await self.adapter.commit()
         last_id = cur.lastrowid  # type: ignore[attr-defined]
@@ -47,7 +48,7 @@ class AsyncSQLerDB:
 
     async def upsert_document(self, table: str, _id: Optional[int], doc: dict[str, Any]) -> int:
         await self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         if _id is None:
             return await self.insert_document(table, doc)
         cur = await self.adapter.execute(
@@ -85,7 +86,7 @@ class AsyncSQLerDB:
         self, table: str, _id: Optional[int], doc: dict[str, Any], expected_version: Optional[int]
     ) -> tuple[int, int]:
         await self._ensure_versioned_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         if _id is None:
             cur = await self.adapter.execute(
                 f"INSERT INTO {table} (data, _version) VALUES (json(?), 0);",
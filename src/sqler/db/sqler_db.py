@@ -5,6 +5,10 @@ from typing import Any, Optional
 from sqler.adapter import SQLiteAdapter
 from sqler.query import SQLerQuery
 
+# Compact encoder built once: json.dumps(..., separators=...) constructs a new
+# JSONEncoder on every call because of the non-default argument.
+_dumps = json.JSONEncoder(separators=(",", ":")).encode
+
 
 class SQLerDB:
     """Document store for JSON blobs on SQLite.
@@ -78,7 +82,7 @@ class SQLerDB:
             int: Newly assigned ``_id``.
         """
         self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         cursor = self.adapter.execute(f"INSERT INTO {table} (data) VALUES (json(?));", [payload])
         self.adapter.commit()
         return cursor.lastrowid
@@ -95,7 +99,7 @@ class SQLerDB:
             int: The existing or newly assigned ``_id``.
         """
         self._ensure_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         if _id is None:
             return self.insert_document(table, doc)
         self.adapter.execute(f"UPDATE {table} SET data = json(?) WHERE _id = ?;", [payload, _id])
@@ -122,7 +126,7 @@ class SQLerDB:
             for doc in docs:
                 doc_id = doc.get("_id")
                 payload_dict = {k: v for k, v in doc.items() if k != "_id"}
-                payload = json.dumps(payload_dict)
+                payload = _dumps(payload_dict)
                 if doc_id is None:
                     cursor = adapter.execute(
                         f"INSERT INTO {table} (data) VALUES (json(?));",
@@ -355,7 +359,7 @@ class SQLerDB:
         """
         if table not in self._versioned_tables:
             self._ensure_versioned_table(table)
-        payload = json.dumps(doc)
+        payload = _dumps(doc)
         if _id is None:
             cur = self.adapter.execute(
                 f"INSERT INTO {table} (data, _version) VALUES (json(?), 0);",
@@ -397,7 +401,8 @@ class SQLerDB:
         Returns:
             dict | None: Decoded document with ``_id`` and ``_version`` keys, or None.
         """
-        self._ensure_versioned_table(table)
+        if table not in self._versioned_tables:
+            self._ensure_versioned_table(table)
         cur = self.adapter.execute(f"SELECT _id, data, _version FROM {table} WHERE _id = ?;", [_id])
         row = cur.fetchone()
         if not row:
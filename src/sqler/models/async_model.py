@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any, ClassVar, Optional, Type, TypeVar
+import json
+from typing import Any, ClassVar, Iterable, Optional, Type, TypeVar
 
 from pydantic import BaseModel, PrivateAttr
 
 from sqler import registry
 from sqler.db.async_db import AsyncSQLerDB
 from sqler.models.async_queryset import AsyncSQLerQuerySet
+from sqler.models.model import _carry_ids, _has_model_fields
 from sqler.query import SQLerExpression
 from sqler.query.async_query import AsyncSQLerQuery
 
@@ -20,6 +22,8 @@ class AsyncSQLerModel(BaseModel):
     _id: Optional[int] = PrivateAttr(default=None)
     _db: ClassVar[Optional[AsyncSQLerDB]] = None
     _table: ClassVar[Optional[str]] = None
+    # opt-in: hydrate rows with model_construct (see SQLerModel._trust_db)
+    _trust_db: ClassVar[bool] = False
 
     model_config = {"extra": "ignore"}
 
@@ -43,6 +47,15 @@ class AsyncSQLerModel(BaseModel):
             raise RuntimeError("Model is not bound. Call set_db(db, table?) first.")
         return cls._db, cls._table
 
+    @classmethod
+    def _from_db(cls: Type[TAModel], doc: dict[str, Any]) -> TAModel:
+        # nested-model/relation fields need validation to be built (see SQLerModel._from_db)
+        if cls._trust_db and not _has_model_fields(cls):
+            return cls.model_construct(**doc)
+        inst = cls.model_validate(doc)
+        _carry_ids(inst, doc)
+        return inst
+
     @classmethod
     async def from_id(cls: Type[TAModel], id_: int) -> Optional[TAModel]:
         db, table = cls._require_binding()
@@ -50,10 +63,20 @@ class AsyncSQLerModel(BaseModel):
         if doc is None:
             return None
         doc = await cls._aresolve_relations(doc)
-        inst = cls.model_validate(doc)
+        inst = cls._from_db(doc)
         inst._id = doc.get("_id")
         return inst  # type: ignore[return-value]
 
+    @classmethod
+    async def from_ids(cls: Type[TAModel], ids: Iterable[int]) -> list[TAModel]:
+        wanted = [int(i) for i in ids]
+        if not wanted:
+            return []
+        unique = list(dict.fromkeys(wanted))
+        expr = SQLerExpression("_id IN (SELECT value FROM json_each(?))", [json.dumps(unique)])
+        by_id = {inst._id: inst for inst in await cls.query().filter(expr).all()}
+        return [by_id[i] for i in wanted if i in by_id]
+
     @classmethod
     def query(cls: Type[TAModel]) -> AsyncSQLerQuerySet[TAModel]:
         db, table = cls._require_binding()
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import json
 from typing import Any, Generic, Optional, Type, TypeVar
 
 from sqler.query import SQLerExpression
 from sqler.query.async_query import AsyncSQLerQuery
 
+from .queryset import _batch_select
+
 T = TypeVar("T")
 
 
@@ -34,6 +37,9 @@ class AsyncSQLerQuerySet(Generic[T]):
     def limit(self, n: int) -> "AsyncSQLerQuerySet[T]":
         return self.__class__(self._model_cls, self._query.limit(n))
 
+    def offset(self, n: int) -> "AsyncSQLerQuerySet[T]":
+        return self.__class__(self._model_cls, self._query.offset(n))
+
     # execution
     async def all(self) -> list[T]:
         docs = await self._query.all_dicts()
@@ -50,9 +56,11 @@ class AsyncSQLerQuerySet(Generic[T]):
                     d = await aresolver(d)  # type: ignore[assignment]
                 except Exception:
                     pass
-            inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+            inst = self._model_cls._from_db(d)  # type: ignore[attr-defined]
             try:
                 inst._id = d.get("_id")  # type: ignore[attr-defined]
+                if "_version" in d:
+                    inst._version = d.get("_version")  # type: ignore[attr-defined]
             except Exception:
                 pass
             results.append(inst)
@@ -67,13 +75,19 @@ class AsyncSQLerQuerySet(Generic[T]):
                 d = (await self._abatch_resolve([d]))[0]
             except Exception:
                 pass
-        inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+        inst = self._model_cls._from_db(d)  # type: ignore[attr-defined]
         try:
             inst._id = d.get("_id")  # type: ignore[attr-defined]
         except Exception:
             pass
         return inst
 
+    async def values(self, *fields: str) -> list[tuple[Any, ...]]:
+        return await self._query.values(*fields)
+
+    async def pluck(self, field: str) -> list[Any]:
+        return await self._query.pluck(field)
+
     async def count(self) -> int:
         return await self._query.count()
 
@@ -106,11 +120,13 @@ class AsyncSQLerQuerySet(Generic[T]):
         refs_by_table: dict[str, set[int]] = {}
 
         def collect(value):
-            if isinstance(value, dict) and "_table" in value and "_id" in value:
-                refs_by_table.setdefault(value["_table"], set()).add(int(value["_id"]))
-            elif isinstance(value, dict):
-                for v in value.values():
-                    collect(v)
+            if isinstance(value, dict):
+                table = value.get("_table")
+                if table is not None and "_id" in value:
+                    refs_by_table.setdefault(table, set()).add(int(value["_id"]))
+                else:
+                    for v in value.values():
+                        collect(v)
             elif isinstance(value, list):
                 for v in value:
                     collect(v)
@@ -120,34 +136,34 @@ class AsyncSQLerQuerySet(Generic[T]):
 
         resolved: dict[tuple[str, int], dict] = {}
         adapter = self._query._adapter  # type: ignore[attr-defined]
-        for table, ids in refs_by_table.items():
-            if not ids:
-                continue
-            placeholders = ",".join(["?"] * len(ids))
-            sql = f"SELECT _id, data FROM {table} WHERE _id IN ({placeholders})"
-            cur = await adapter.execute(sql, list(ids))
+        sql, params = _batch_select(refs_by_table)
+        if sql:
+            cur = await adapter.execute(sql, params)
             rows = await cur.fetchall()
             await cur.close()
-            for _id, data_json in rows:
-                import json
-
+            for _id, data_json, table in rows:
                 obj = json.loads(data_json)
                 obj["_id"] = _id
                 resolved[(table, int(_id))] = obj
 
-        visited: set[tuple[str, int]] = set()
-
-        def replace(value):
-            if isinstance(value, dict) and "_table" in value and "_id" in value:
-                key = (value["_table"], int(value["_id"]))
-                if key in visited:
-                    return value
-                visited.add(key)
-                return resolved.get(key, value)
-            if isinstance(value, dict):
-                return {k: replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [replace(v) for v in value]
-            return value
-
-        return [replace(d) for d in docs]
+        # replace in-doc refs with fetched payloads, per-document visited guard
+        def make_replace():
+            visited: set[tuple[str, int]] = set()
+
+            def replace(value):
+                if isinstance(value, dict):
+                    table = value.get("_table")
+                    if table is not None and "_id" in value:
+                        key = (table, int(value["_id"]))
+                        if key in visited:
+                            return value
+                        visited.add(key)
+                        return resolved.get(key, value)
+                    return {k: replace(v) for k, v in value.items()}
+                if isinstance(value, list):
+                    return [replace(v) for v in value]
+                return value
+
+            return replace
+
+        return [make_replace()(d) for d in docs]
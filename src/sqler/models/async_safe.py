@@ -42,7 +42,7 @@ class AsyncSQLerSafeModel(AsyncSQLerModel):
         doc = await db.find_document_with_version(table, id_)
         if doc is None:
             return None
-        inst = cls.model_validate(doc)  # type: ignore[call-arg]
+        inst = cls._from_db(doc)
         inst._id = doc.get("_id")
         inst._version = doc.get("_version", 0)
         try:
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import ClassVar, Optional, Type, TypeVar
+import json
+from functools import cache
+from typing import Any, ClassVar, Iterable, Optional, Type, TypeVar, get_args
 
 from pydantic import BaseModel, PrivateAttr
 
 from sqler import registry
-from sqler.db.sqler_db import SQLerDB
+from sqler.db.sqler_db import SQLerDB, _dumps
 from sqler.models.queryset import SQLerQuerySet
 from sqler.query import SQLerExpression
 
@@ -22,6 +24,38 @@ def _default_table_name(name: str) -> str:
     return base
 
 
+@cache
+def _has_model_fields(cls: type[BaseModel]) -> bool:
+    """Return True when any field's annotation mentions a pydantic model.
+
+    Such fields (relations, nested models) are only built by validation;
+    ``model_construct`` would leave them as plain dicts.
+    """
+
+    def mentions_model(tp: Any) -> bool:
+        if isinstance(tp, type) and issubclass(tp, BaseModel):
+            return True
+        return any(mentions_model(arg) for arg in get_args(tp))
+
+    return any(mentions_model(f.annotation) for f in cls.model_fields.values())
+
+
+def _carry_ids(value: Any, raw: Any) -> None:
+    """Copy ``_id`` from hydrated ref dicts onto the nested models built from them.
+
+    ``_id`` is a private attribute, so validation drops it; without it a loaded
+    relation could not be written back as a ``{_table, _id}`` ref.
+    """
+    if isinstance(value, BaseModel) and isinstance(raw, dict):
+        if "_id" in value.__private_attributes__ and value._id is None:
+            value._id = raw.get("_id")
+        for name in type(value).model_fields:
+            _carry_ids(getattr(value, name, None), raw.get(name))
+    elif isinstance(value, list) and isinstance(raw, list):
+        for v, r in zip(value, raw):
+            _carry_ids(v, r)
+
+
 class SQLerModel(BaseModel):
     """Pydantic-based model with persistence helpers for SQLerDB.
 
@@ -39,6 +73,10 @@ class SQLerModel(BaseModel):
     # class-bound db + table metadata
     _db: ClassVar[Optional[SQLerDB]] = None
     _table: ClassVar[Optional[str]] = None
+    # Opt-in: when the table is only ever written through this model, stored
+    # documents are already valid and rows hydrate via ``model_construct``.
+    # Ignored for models with nested-model or relation fields.
+    _trust_db: ClassVar[bool] = False
 
     # ----- class config -----
     model_config = {
@@ -55,6 +93,10 @@ class SQLerModel(BaseModel):
             db: Database instance to use for persistence.
             table: Optional table name. Defaults to lowercase plural of the
                 class name (e.g., ``User`` → ``users``).
+
+        Fields listed in an inner ``class Meta: indexed_fields = [...]`` get an
+        expression index (see ``SQLerDB.create_index``), so filters on them can
+        seek instead of scanning the table.
         """
         explicit = getattr(cls, "__tablename__", None)
         chosen = table or explicit or _default_table_name(cls.__name__)
@@ -62,6 +104,8 @@ class SQLerModel(BaseModel):
         cls._table = chosen
         cls.__tablename__ = chosen
         cls._db._ensure_table(cls._table)
+        for field in getattr(getattr(cls, "Meta", None), "indexed_fields", ()):
+            cls._db.create_index(cls._table, field)
         registry.register(cls._table, cls)
 
     @classmethod
@@ -107,6 +151,22 @@ class SQLerModel(BaseModel):
             raise RuntimeError("Model is not bound. Call set_db(db, table?) first.")
         return cls._db, cls._table
 
+    @classmethod
+    def _from_db(cls: Type[TModel], doc: dict[str, Any]) -> TModel:
+        """Build an instance from a stored document.
+
+        Validates via ``model_validate`` unless the class sets ``_trust_db``, in
+        which case field validation is skipped. Models with nested-model or
+        relation fields are always validated, since only validation builds
+        those (and ``save()`` needs them to write refs). Never use this for
+        client input.
+        """
+        if cls._trust_db and not _has_model_fields(cls):
+            return cls.model_construct(**doc)
+        inst = cls.model_validate(doc)
+        _carry_ids(inst, doc)
+        return inst
+
     @classmethod
     def from_id(cls: Type[TModel], id_: int) -> Optional[TModel]:
         """Hydrate an instance by ``_id``.
@@ -122,11 +182,29 @@ class SQLerModel(BaseModel):
         if doc is None:
             return None
         doc = cls._resolve_relations(doc)
-        inst = cls.model_validate(doc)  # type: ignore[call-arg]
+        inst = cls._from_db(doc)
         # attach db id stored outside the json payload
         inst._id = doc.get("_id")
         return inst  # type: ignore[return-value]
 
+    @classmethod
+    def from_ids(cls: Type[TModel], ids: Iterable[int]) -> list[TModel]:
+        """Hydrate several instances with a single ``_id IN (...)`` query.
+
+        Args:
+            ids: Row ids to load; duplicates are allowed.
+
+        Returns:
+            Instances in the order of ``ids``; ids with no row are skipped.
+        """
+        wanted = [int(i) for i in ids]
+        if not wanted:
+            return []
+        unique = list(dict.fromkeys(wanted))
+        expr = SQLerExpression("_id IN (SELECT value FROM json_each(?))", [json.dumps(unique)])
+        by_id = {inst._id: inst for inst in cls.query().filter(expr).all()}
+        return [by_id[i] for i in wanted if i in by_id]
+
     @classmethod
     def query(cls: Type[TModel]) -> SQLerQuerySet[TModel]:
         """Return a queryset for chaining and execution."""
@@ -346,7 +424,7 @@ class SQLerModel(BaseModel):
                 return value
 
             new_obj = replace(obj)
-            payload = json.dumps(new_obj)
+            payload = _dumps(new_obj)
             db.adapter.execute(
                 f"UPDATE {table} SET data = json(?) WHERE _id = ?;", [payload, row_id]
             )
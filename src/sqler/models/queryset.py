@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 from typing import Any, Generic, Optional, Type, TypeVar
 
 from sqler.query import SQLerExpression, SQLerQuery
@@ -7,6 +8,27 @@ from sqler.query import SQLerExpression, SQLerQuery
 T = TypeVar("T")
 
 
+def _batch_select(refs_by_table: dict[str, set[int]]) -> tuple[str, list[Any]]:
+    """Build one ``UNION ALL`` SELECT fetching every referenced row.
+
+    Each branch yields ``(_id, data, table)``. The ids are bound as a single JSON
+    array read back through ``json_each``, so the SQL text depends only on which
+    tables are referenced, not on how many ids, and sqlite3's statement cache
+    reuses the prepared statement across calls.
+    """
+    parts: list[str] = []
+    params: list[Any] = []
+    for table, ids in refs_by_table.items():
+        if not ids:
+            continue
+        parts.append(
+            f"SELECT _id, data, ? FROM {table} WHERE _id IN (SELECT value FROM json_each(?))"
+        )
+        params.append(table)
+        params.append(json.dumps(sorted(ids)))
+    return " UNION ALL ".join(parts), params
+
+
 class SQLerQuerySet(Generic[T]):
     """Query wrapper that materializes model instances.
 
@@ -46,6 +68,10 @@ class SQLerQuerySet(Generic[T]):
         """Return a new queryset with a LIMIT clause."""
         return self.__class__(self._model_cls, self._query.limit(n))
 
+    def offset(self, n: int) -> "SQLerQuerySet[T]":
+        """Return a new queryset with an OFFSET clause."""
+        return self.__class__(self._model_cls, self._query.offset(n))
+
     # execution
     def all(self) -> list[T]:
         """Execute and return a list of model instances."""
@@ -57,7 +83,7 @@ class SQLerQuerySet(Generic[T]):
                 pass
         results: list[T] = []
         for d in docs:
-            inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+            inst = self._model_cls._from_db(d)  # type: ignore[attr-defined]
             # attach db id if present but excluded from schema
             try:
                 inst._id = d.get("_id")  # type: ignore[attr-defined]
@@ -81,7 +107,7 @@ class SQLerQuerySet(Generic[T]):
                 d = self._batch_resolve([d])[0]
             except Exception:
                 pass
-        inst = self._model_cls.model_validate(d)  # type: ignore[attr-defined]
+        inst = self._model_cls._from_db(d)  # type: ignore[attr-defined]
         try:
             inst._id = d.get("_id")  # type: ignore[attr-defined]
             if "_version" in d:
@@ -92,6 +118,14 @@ class SQLerQuerySet(Generic[T]):
             pass
         return inst
 
+    def values(self, *fields: str) -> list[tuple[Any, ...]]:
+        """Return only ``fields`` per row as tuples, without building models."""
+        return self._query.values(*fields)
+
+    def pluck(self, field: str) -> list[Any]:
+        """Return one field per row as a flat list, gathered in a single value."""
+        return self._query.pluck(field)
+
     def count(self) -> int:
         """Return the count of matching rows."""
         return self._query.count()
@@ -121,11 +155,13 @@ class SQLerQuerySet(Generic[T]):
         refs_by_table: dict[str, set[int]] = {}
 
         def collect(value):
-            if isinstance(value, dict) and "_table" in value and "_id" in value:
-                refs_by_table.setdefault(value["_table"], set()).add(int(value["_id"]))
-            elif isinstance(value, dict):
-                for v in value.values():
-                    collect(v)
+            if isinstance(value, dict):
+                table = value.get("_table")
+                if table is not None and "_id" in value:
+                    refs_by_table.setdefault(table, set()).add(int(value["_id"]))
+                else:
+                    for v in value.values():
+                        collect(v)
             elif isinstance(value, list):
                 for v in value:
                     collect(v)
@@ -133,19 +169,13 @@ class SQLerQuerySet(Generic[T]):
         for d in docs:
             collect(d)
 
-        # fetch all refs per table
+        # fetch all refs across tables in a single round-trip
         resolved: dict[tuple[str, int], dict] = {}
         adapter = self._query._adapter  # type: ignore[attr-defined]
-        for table, ids in refs_by_table.items():
-            if not ids:
-                continue
-            placeholders = ",".join(["?"] * len(ids))
-            sql = f"SELECT _id, data FROM {table} WHERE _id IN ({placeholders})"
-            cur = adapter.execute(sql, list(ids))
-            rows = cur.fetchall()
-            for _id, data_json in rows:
-                import json
-
+        sql, params = _batch_select(refs_by_table)
+        if sql:
+            rows = adapter.execute(sql, params).fetchall()
+            for _id, data_json, table in rows:
                 obj = json.loads(data_json)
                 obj["_id"] = _id
                 resolved[(table, int(_id))] = obj
@@ -155,13 +185,14 @@ class SQLerQuerySet(Generic[T]):
             visited: set[tuple[str, int]] = set()
 
             def replace(value):
-                if isinstance(value, dict) and "_table" in value and "_id" in value:
-                    key = (value["_table"], int(value["_id"]))
-                    if key in visited:
-                        return value
-                    visited.add(key)
-                    return resolved.get(key, value)
                 if isinstance(value, dict):
+                    table = value.get("_table")
+                    if table is not None and "_id" in value:
+                        key = (table, int(value["_id"]))
+                        if key in visited:
+                            return value
+                        visited.add(key)
+                        return resolved.get(key, value)
                     return {k: replace(v) for k, v in value.items()}
                 if isinstance(value, list):
                     return [replace(v) for v in value]
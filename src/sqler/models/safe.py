@@ -43,7 +43,7 @@ class SQLerSafeModel(SQLerModel):
         doc = db.find_document_with_version(table, id_)
         if doc is None:
             return None
-        inst = cls.model_validate(doc)  # type: ignore[call-arg]
+        inst = cls._from_db(doc)
         inst._id = doc.get("_id")  # type: ignore[attr-defined]
         inst._version = doc.get("_version", 0)  # type: ignore[attr-defined]
         return inst  # type: ignore[return-value]
@@ -1,7 +1,9 @@
+import json
 from typing import Any, Optional, Self
 
 from sqler.adapter.asynchronous import AsyncSQLiteAdapter
 from sqler.query.expression import SQLerExpression
+from sqler.query.query import InvariantViolationError, _column_sql
 
 
 class AsyncSQLerQuery:
@@ -16,6 +18,7 @@ class AsyncSQLerQuery:
         desc: bool = False,
         limit: Optional[int] = None,
         include_version: bool = False,
+        offset: Optional[int] = None,
     ):
         self._table = table
         self._adapter = adapter
@@ -24,6 +27,7 @@ class AsyncSQLerQuery:
         self._desc = desc
         self._limit = limit
         self._include_version = include_version
+        self._offset = offset
 
     def filter(self, expression: SQLerExpression) -> Self:
         new_expression = expression if self._expression is None else (self._expression & expression)
@@ -35,6 +39,7 @@ class AsyncSQLerQuery:
             self._desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def exclude(self, expression: SQLerExpression) -> Self:
@@ -48,6 +53,7 @@ class AsyncSQLerQuery:
             self._desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def order_by(self, field: str, desc: bool = False) -> Self:
@@ -59,6 +65,7 @@ class AsyncSQLerQuery:
             desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def limit(self, n: int) -> Self:
@@ -70,6 +77,19 @@ class AsyncSQLerQuery:
             self._desc,
             n,
             self._include_version,
+            self._offset,
+        )
+
+    def offset(self, n: int) -> Self:
+        return self.__class__(
+            self._table,
+            self._adapter,
+            self._expression,
+            self._order,
+            self._desc,
+            self._limit,
+            self._include_version,
+            n,
         )
 
     def with_version(self) -> Self:
@@ -81,19 +101,23 @@ class AsyncSQLerQuery:
             self._desc,
             self._limit,
             True,
+            self._offset,
         )
 
-    def _build_query(self, *, include_id: bool = False) -> tuple[str, list[Any]]:
+    def _build_query(
+        self, *, include_id: bool = False, select: Optional[str] = None
+    ) -> tuple[str, list[Any]]:
         where = f"WHERE {self._expression.sql}" if self._expression else ""
         order = ""
         if self._order:
-            order = f"ORDER BY json_extract(data, '$.{self._order}')" + (
-                " DESC" if self._desc else ""
-            )
+            # underscore-prefixed names are real columns (e.g. ``_id``), like create_index
+            order = f"ORDER BY {_column_sql(self._order)}" + (" DESC" if self._desc else "")
         limit = f"LIMIT {self._limit}" if self._limit is not None else ""
-        if include_id:
+        if self._offset:
+            limit = f"{limit or 'LIMIT -1'} OFFSET {self._offset}"
+        if select is None and include_id:
             select = "_id, data" + (", _version" if self._include_version else "")
-        else:
+        elif select is None:
             select = "data"
         sql = f"SELECT {select} FROM {self._table} {where} {order} {limit}".strip()
         sql = " ".join(sql.split())
@@ -117,6 +141,14 @@ class AsyncSQLerQuery:
         await cur.close()
         return [row[0] for row in rows]
 
+    async def all_parsed(self) -> list[Any]:
+        rows = await self.all()
+        # one decode call over the joined rows instead of json.loads per row
+        try:
+            return json.loads("[" + ",".join(rows) + "]")
+        except TypeError:
+            raise InvariantViolationError(f"Row in {self._table} has NULL data JSON") from None
+
     async def first(self) -> Optional[str]:
         if self._adapter is None:
             raise ConnectionError("No adapter set for query")
@@ -127,7 +159,7 @@ class AsyncSQLerQuery:
     async def count(self) -> int:
         if self._adapter is None:
             raise ConnectionError("No adapter set for query")
-        sql, params = self._build_query()
+        sql, params = self.__class__(self._table, self._adapter, self._expression)._build_query()
         count_sql = sql.replace("SELECT data", "SELECT count(*)")
         cur = await self._adapter.execute(count_sql, params)
         row = await cur.fetchone()
@@ -137,8 +169,6 @@ class AsyncSQLerQuery:
     async def all_dicts(self) -> list[dict[str, Any]]:
         if self._adapter is None:
             raise ConnectionError("No adapter set for query")
-        import json
-
         sql, params = self._build_query(include_id=True)
         cur = await self._adapter.execute(sql, params)
         rows = await cur.fetchall()
@@ -157,6 +187,24 @@ class AsyncSQLerQuery:
             docs.append(obj)
         return docs
 
+    async def values(self, *fields: str) -> list[tuple[Any, ...]]:
+        if self._adapter is None:
+            raise ConnectionError("No adapter set for query")
+        sql, params = self._build_query(select=", ".join(_column_sql(f) for f in fields))
+        cur = await self._adapter.execute(sql, params)
+        rows = await cur.fetchall()
+        await cur.close()
+        return [tuple(row) for row in rows]
+
+    async def pluck(self, field: str) -> list[Any]:
+        if self._adapter is None:
+            raise ConnectionError("No adapter set for query")
+        sql, params = self._build_query(select=f"{_column_sql(field)} AS v")
+        cur = await self._adapter.execute(f"SELECT json_group_array(v) FROM ({sql})", params)
+        row = await cur.fetchone()
+        await cur.close()
+        return json.loads(row[0])
+
     async def first_dict(self) -> Optional[dict[str, Any]]:
         res = await self.limit(1).all_dicts()
         return res[0] if res else None
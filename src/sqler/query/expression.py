@@ -1,29 +1,45 @@
-from typing import Any, Optional, Self
+from typing import Any, Optional
+
+
+def _cost_rank(sql: str) -> int:
+    """rough evaluation cost: plain comparisons 0, LIKE 1, json_each subqueries 2"""
+    if "json_each(" in sql:
+        return 2
+    if " LIKE " in sql:
+        return 1
+    return 0
 
 
 class SQLerExpression:
     """sql expression fragment with parameters; supports & for and, | for or, ~ for not"""
 
+    # sql is rendered once at construction; slots keep per-node size down in big trees
+    __slots__ = ("sql", "params")
+
     def __init__(self, sql: str, params: Optional[list[Any]] = None):
         """init with sql fragment and param list; sql like "foo > ?" or "json_extract(data, '$.x') = ?" """
         self.sql = sql
         self.params = params or []
 
-    def __and__(self, other: Self) -> Self:
-        """combine two exprs with and; params concatenated"""
-        return self.__class__(f"({self.sql}) AND ({other.sql})", self.params + other.params)
+    def __and__(self, other: "SQLerExpression") -> "SQLerExpression":
+        """combine two exprs with and; params concatenated; cheaper side goes first"""
+        if _cost_rank(self.sql) > _cost_rank(other.sql):
+            self, other = other, self
+        return SQLerExpression(f"({self.sql}) AND ({other.sql})", self.params + other.params)
 
-    def __or__(self, other: Self) -> Self:
-        """combine two exprs with or; params concatenated"""
-        return self.__class__(f"({self.sql}) OR ({other.sql})", self.params + other.params)
+    def __or__(self, other: "SQLerExpression") -> "SQLerExpression":
+        """combine two exprs with or; params concatenated; cheaper side goes first"""
+        if _cost_rank(self.sql) > _cost_rank(other.sql):
+            self, other = other, self
+        return SQLerExpression(f"({self.sql}) OR ({other.sql})", self.params + other.params)
 
-    def __invert__(self) -> Self:
+    def __invert__(self) -> "SQLerExpression":
         """negate expr with not"""
-        return self.__class__(f"NOT ({self.sql})", self.params)
+        return SQLerExpression(f"NOT ({self.sql})", self.params)
 
     def __eq__(self, other: object) -> bool:
         """equality for testing"""
-        if not isinstance(other, self.__class__):
+        if not isinstance(other, SQLerExpression):
             return False
         return self.sql == other.sql and self.params == other.params
 
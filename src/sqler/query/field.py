@@ -1,3 +1,5 @@
+import re
+from functools import lru_cache
 from typing import Any, List, Optional, Tuple, Union
 
 from sqler.query import SQLerExpression
@@ -17,6 +19,64 @@ def _normalize_alias_stack(
     return norm
 
 
+# keys that can appear unquoted in a sqlite json path
+_PLAIN_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+@lru_cache(maxsize=1024)
+def _render_json_path(path: Tuple[Union[str, int], ...]) -> str:
+    """
+    render a path tuple once; queries repeat the same few field names, so the
+    per-segment quoting checks are shared across all fields with that path
+    """
+    parts = ["$"]
+    for segment in path:
+        if isinstance(segment, int):
+            parts.append(f"[{segment}]")
+        elif _PLAIN_KEY.match(segment):
+            parts.append(f".{segment}")
+        else:
+            # quotes if not valid json key
+            escaped = segment.replace('"', '\\"')
+            parts.append(f'."{escaped}"')
+    return "".join(parts)
+
+
+# most ASCII letters a prefix may hold before like() stops rewriting it into ranges;
+# LIKE folds ASCII case, so each letter doubles the number of ranges
+_MAX_PREFIX_LETTERS = 2
+
+
+def _prefix_ranges(pattern: str) -> Optional[List[Tuple[str, str]]]:
+    """
+    turn a left-anchored LIKE pattern ('ab%') into [lo, hi) text ranges, one per
+    ASCII case variant of the prefix; None when the rewrite would change matches
+    (other wildcards, too many letters, a prefix a number could render as, or a
+    last char without a successor)
+    """
+    prefix = pattern[:-1]
+    if not prefix or not pattern.endswith("%") or "%" in prefix or "_" in prefix:
+        return None
+    # numbers LIKE-match through their text form but never compare within a text range
+    if prefix[0] in "0123456789+-.Ii":
+        return None
+    letters = [i for i, ch in enumerate(prefix) if ch.isascii() and ch.isalpha()]
+    if len(letters) > _MAX_PREFIX_LETTERS:
+        return None
+    variants = [prefix]
+    for i in letters:
+        variants = [
+            v[:i] + c + v[i + 1 :] for v in variants for c in (v[i].upper(), v[i].lower())
+        ]
+    ranges = []
+    for v in variants:
+        nxt = ord(v[-1]) + 1
+        if nxt > 0x10FFFF or 0xD800 <= nxt <= 0xDFFF:
+            return None
+        ranges.append((v, v[:-1] + chr(nxt)))
+    return ranges
+
+
 class SQLerField:
     """
     proxy for a json field lets you do: field == x, field > 5, field['a'], field / 'b', field.any(), etc
@@ -40,15 +100,15 @@ class SQLerField:
       SQLerField(['arr']).any()['field'] == 5
       # -> EXISTS (
       #     SELECT 1
-      #     FROM json_each(json_extract(data, '$.arr')) AS a
+      #     FROM json_each(data, '$.arr') AS a
       #     WHERE json_extract(a.value, '$.field') = ?
       #   )
 
       SQLerField(['level1']).any()['arr2'].any()['val'] > 0
       # -> EXISTS (
       #     SELECT 1
-      #     FROM json_each(json_extract(data, '$.level1')) AS a
-      #     JOIN json_each(json_extract(a.value, '$.arr2')) AS b
+      #     FROM json_each(data, '$.level1') AS a
+      #     JOIN json_each(a.value, '$.arr2') AS b
       #     WHERE json_extract(b.value, '$.val') > ?
       #   )
 
@@ -89,26 +149,7 @@ class SQLerField:
         build a sqlite json path string
           ex: ['a', 'b', 1, 'c'] -> '$.a.b[1].c'
         """
-        import re
-
-        if not self.path:
-            return "$"
-
-        def needs_quoting(s: str) -> bool:
-            # quotes if not valid json key
-            return not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", s)
-
-        parts = ["$"]
-        for segment in self.path:
-            if isinstance(segment, int):
-                parts.append(f"[{segment}]")
-            else:
-                if needs_quoting(segment):
-                    escaped = segment.replace('"', '\\"')
-                    parts.append(f'."{escaped}"')
-                else:
-                    parts.append(f".{segment}")
-        return "".join(parts)
+        return _render_json_path(tuple(self.path))
 
     def any(self) -> "SQLerAnyContext":
         """
@@ -117,15 +158,15 @@ class SQLerField:
           SQLerField(['arr1']).any()['val'] == 10
           # -> EXISTS (
           #     SELECT 1
-          #     FROM json_each(json_extract(data, '$.arr1')) AS a
+          #     FROM json_each(data, '$.arr1') AS a
           #     WHERE json_extract(a.value, '$.val') = ?
           #   )
         you can chain:
           SQLerField(['level1']).any()['arr2'].any()['score'] > 50
           # -> EXISTS (
           #     SELECT 1
-          #     FROM json_each(json_extract(data, '$.level1')) AS a
-          #     JOIN json_each(json_extract(a.value, '$.arr2')) AS b
+          #     FROM json_each(data, '$.level1') AS a
+          #     JOIN json_each(a.value, '$.arr2') AS b
           #     WHERE json_extract(b.value, '$.score') > ?
           #   )
         """
@@ -211,11 +252,19 @@ class SQLerField:
     def like(self, pattern: str) -> SQLerExpression:
         """
         pattern matching with LIKE
-          SQLerField('field1').like('a%')
+          SQLerField('field1').like('%a%')
           # -> JSON_EXTRACT(data, '$.field1') LIKE ?
+        short prefix patterns become ranges an index on the field can seek:
+          SQLerField('field1').like('a%')
+          # -> ((JSON_EXTRACT(data, '$.field1') >= ? AND JSON_EXTRACT(data, '$.field1') < ?)
+          #     OR (JSON_EXTRACT(data, '$.field1') >= ? AND ...))  with ['A', 'B', 'a', 'b']
         """
-        expr = f"JSON_EXTRACT(data, '{self._json_path()}') LIKE ?"
-        return SQLerExpression(expr, [pattern])
+        col = f"JSON_EXTRACT(data, '{self._json_path()}')"
+        ranges = _prefix_ranges(pattern)
+        if ranges is None:
+            return SQLerExpression(f"{col} LIKE ?", [pattern])
+        sql = " OR ".join(f"({col} >= ? AND {col} < ?)" for _ in ranges)
+        return SQLerExpression(f"({sql})", [bound for pair in ranges for bound in pair])
 
 
 class SQLerAnyExpression(SQLerExpression):
@@ -226,19 +275,21 @@ class SQLerAnyExpression(SQLerExpression):
       SQLerField(['arr']).any()['val'] == 1
       # -> EXISTS (
       #     SELECT 1
-      #     FROM json_each(json_extract(data, '$.arr')) AS a
+      #     FROM json_each(data, '$.arr') AS a
       #     WHERE json_extract(a.value, '$.val') = ?
       #   )
 
       SQLerField(['level1']).any()['arr2'].any()['field3'] > 100
       # -> EXISTS (
       #     SELECT 1
-      #     FROM json_each(json_extract(data, '$.level1')) AS a
-      #     JOIN json_each(json_extract(a.value, '$.arr2')) AS b
+      #     FROM json_each(data, '$.level1') AS a
+      #     JOIN json_each(a.value, '$.arr2') AS b
       #     WHERE json_extract(b.value, '$.field3') > ?
       #   )
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         path: List[Union[str, int]],
@@ -272,7 +323,7 @@ class SQLerAnyExpression(SQLerExpression):
 
         first_alias = aliases[0]
         # first FROM: make a table out of the first array
-        joins.append(f"json_each(json_extract(data, '{base_json}')) AS {first_alias}")
+        joins.append(f"json_each(data, '{base_json}') AS {first_alias}")
         first_where = norm[0][2]
         if first_where is not None:
             wsql, wparams = _scope_expr(first_where, first_alias)
@@ -282,8 +333,8 @@ class SQLerAnyExpression(SQLerExpression):
 
         # handle more .any()s: join each nested array
         for alias, array_key, wexpr in norm[1:]:
-            # e.g. JOIN json_each(json_extract(a.value, '$.arr2')) AS b
-            joins.append(f"json_each(json_extract({prev_alias}.value, '$.{array_key}')) AS {alias}")
+            # e.g. JOIN json_each(a.value, '$.arr2') AS b
+            joins.append(f"json_each({prev_alias}.value, '$.{array_key}') AS {alias}")
             if wexpr is not None:
                 wsql, wparams = _scope_expr(wexpr, alias)
                 where_clauses.append(wsql)
@@ -299,8 +350,8 @@ class SQLerAnyExpression(SQLerExpression):
         # full EXISTS clause, e.g. for two-level array:
         # EXISTS (
         #   SELECT 1
-        #   FROM json_each(json_extract(data, '$.level1')) AS a
-        #   JOIN json_each(json_extract(a.value, '$.arr2')) AS b
+        #   FROM json_each(data, '$.level1') AS a
+        #   JOIN json_each(a.value, '$.arr2') AS b
         #   WHERE json_extract(b.value, '$.score') > ?
         # )
         sql = f"EXISTS (SELECT 1 FROM {from_join} WHERE {where})"
@@ -367,7 +418,7 @@ class SQLerAnyContext:
         params: List[Any] = []
 
         first_alias, _, first_where = norm[0]
-        joins.append(f"json_each(json_extract(data, '{base_json}')) AS {first_alias}")
+        joins.append(f"json_each(data, '{base_json}') AS {first_alias}")
         if first_where is not None:
             wsql, wparams = _scope_expr(first_where, first_alias)
             where_clauses.append(wsql)
@@ -375,7 +426,7 @@ class SQLerAnyContext:
         prev_alias = first_alias
 
         for alias, array_key, wexpr in norm[1:]:
-            joins.append(f"json_each(json_extract({prev_alias}.value, '$.{array_key}')) AS {alias}")
+            joins.append(f"json_each({prev_alias}.value, '$.{array_key}') AS {alias}")
             if wexpr is not None:
                 wsql, wparams = _scope_expr(wexpr, alias)
                 where_clauses.append(wsql)
@@ -1,8 +1,12 @@
+import json
 from typing import Any, Optional, Self
 
 from sqler.adapter.abstract import AdapterABC
 from sqler.query import SQLerExpression
 
+# Rows per ``fetchmany`` call when materializing results.
+FETCH_BATCH = 256
+
 
 class QueryError(Exception):
     """Base exception for query errors."""
@@ -20,6 +24,11 @@ class InvariantViolationError(RuntimeError):
     """Raised when reading rows that violate expected invariants (e.g., NULL JSON)."""
 
 
+def _column_sql(field: str) -> str:
+    """Map a field name to SQL: ``_``-prefixed names are columns, others JSON paths."""
+    return field if field.startswith("_") else f"json_extract(data, '$.{field}')"
+
+
 class SQLerQuery:
     """Build and execute chainable queries against a table.
 
@@ -37,6 +46,7 @@ class SQLerQuery:
         desc: bool = False,
         limit: Optional[int] = None,
         include_version: bool = False,
+        offset: Optional[int] = None,
     ):
         self._table = table
         self._adapter = adapter
@@ -45,6 +55,7 @@ class SQLerQuery:
         self._desc = desc
         self._limit = limit
         self._include_version = include_version
+        self._offset = offset
 
     def filter(self, expression: SQLerExpression) -> Self:
         """Return a new query with the expression AND-ed in.
@@ -64,6 +75,7 @@ class SQLerQuery:
             self._desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def exclude(self, expression: SQLerExpression) -> Self:
@@ -85,13 +97,15 @@ class SQLerQuery:
             self._desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def order_by(self, field: str, desc: bool = False) -> Self:
         """Return a new query ordered by the given JSON field.
 
         Args:
-            field: Dotted JSON path to sort by (e.g., ``"age"``).
+            field: Dotted JSON path to sort by (e.g., ``"age"``). Names starting
+                with ``_`` (e.g., ``"_id"``) sort by that column directly.
             desc: Sort descending when True.
 
         Returns:
@@ -105,6 +119,7 @@ class SQLerQuery:
             desc,
             self._limit,
             self._include_version,
+            self._offset,
         )
 
     def limit(self, n: int) -> Self:
@@ -124,6 +139,27 @@ class SQLerQuery:
             self._desc,
             n,
             self._include_version,
+            self._offset,
+        )
+
+    def offset(self, n: int) -> Self:
+        """Return a new query that skips the first ``n`` rows.
+
+        Args:
+            n: Number of rows to skip (emitted as ``OFFSET``).
+
+        Returns:
+            SQLerQuery: New query instance.
+        """
+        return self.__class__(
+            self._table,
+            self._adapter,
+            self._expression,
+            self._order,
+            self._desc,
+            self._limit,
+            self._include_version,
+            n,
         )
 
     def with_version(self) -> Self:
@@ -136,16 +172,22 @@ class SQLerQuery:
             self._desc,
             self._limit,
             True,
+            self._offset,
         )
 
     def _build_query(
-        self, *, include_id: bool = False, include_version: bool = False
+        self,
+        *,
+        include_id: bool = False,
+        include_version: bool = False,
+        select: Optional[str] = None,
     ) -> tuple[str, list[Any]]:
         """Build the SELECT statement and parameters.
 
         Args:
             include_id: When True, select ``_id, data`` instead of only
                 ``data``.
+            select: Explicit select list; overrides ``include_id``.
 
         Returns:
             tuple[str, list[Any]]: SQL string and parameter list.
@@ -153,15 +195,16 @@ class SQLerQuery:
         where = f"WHERE {self._expression.sql}" if self._expression else ""
         order = ""
         if self._order:
-            order = f"ORDER BY json_extract(data, '$.{self._order}')" + (
-                " DESC" if self._desc else ""
-            )
+            # underscore-prefixed names are real columns (e.g. ``_id``), like create_index
+            order = f"ORDER BY {_column_sql(self._order)}" + (" DESC" if self._desc else "")
         limit = f"LIMIT {self._limit}" if self._limit is not None else ""
-        if include_id:
+        if self._offset:
+            limit = f"{limit or 'LIMIT -1'} OFFSET {self._offset}"
+        if select is None and include_id:
             select = "_id, data" + (
                 ", _version" if (include_version or self._include_version) else ""
             )
-        else:
+        elif select is None:
             select = "data"
         sql = f"SELECT {select} FROM {self._table} {where} {order} {limit}".strip()
         sql = " ".join(sql.split())  # collapse double spaces
@@ -207,7 +250,31 @@ class SQLerQuery:
             raise NoAdapterError("No adapter set for query")
         sql, params = self._build_query()
         cur = self._adapter.execute(sql, params)
-        return [row[0] for row in cur.fetchall()]
+        # pull rows in batches rather than one fetchall() list held next to the result
+        cur.arraysize = FETCH_BATCH
+        out: list = []
+        while rows := cur.fetchmany():
+            out.extend(row[0] for row in rows)
+        return out
+
+    def all_parsed(self) -> list[Any]:
+        """Execute and return all matching rows decoded, without ``_id``.
+
+        The rows are joined into one JSON array and decoded with a single
+        ``json.loads`` call, so the per-row loop runs inside the C decoder.
+
+        Raises:
+            NoAdapterError: If the query has no adapter.
+            InvariantViolationError: If a row has NULL data.
+
+        Returns:
+            list[Any]: One decoded document per row, in query order.
+        """
+        rows = self.all()
+        try:
+            return json.loads("[" + ",".join(rows) + "]")
+        except TypeError:
+            raise InvariantViolationError(f"Row in {self._table} has NULL data JSON") from None
 
     def first(self) -> Optional[dict[str, Any]]:
         """Execute with ``LIMIT 1`` and return the first raw JSON string.
@@ -230,7 +297,8 @@ class SQLerQuery:
         """
         if self._adapter is None:
             raise NoAdapterError("No adapter set for query")
-        sql, params = self._build_query()
+        # count the whole match set: ordering, LIMIT and OFFSET don't apply
+        sql, params = self.__class__(self._table, self._adapter, self._expression)._build_query()
         count_sql = sql.replace("SELECT data", "SELECT count(*)")
         cur = self._adapter.execute(count_sql, params)
         row = cur.fetchone()
@@ -247,8 +315,6 @@ class SQLerQuery:
         """
         if self._adapter is None:
             raise NoAdapterError("No adapter set for query")
-        import json
-
         sql, params = self._build_query(include_id=True, include_version=False)
         cur = self._adapter.execute(sql, params)
         rows = cur.fetchall()
@@ -268,6 +334,49 @@ class SQLerQuery:
             docs.append(obj)
         return docs
 
+    def values(self, *fields: str) -> list[tuple[Any, ...]]:
+        """Execute and return only the given fields, one tuple per row.
+
+        Skips JSON decoding of whole documents: each field is selected on its own
+        (``_``-prefixed names as columns, others via ``json_extract``). Nested
+        objects and arrays come back as JSON text.
+
+        Args:
+            fields: Column or dotted JSON field names, e.g. ``"_id", "name"``.
+
+        Raises:
+            NoAdapterError: If the query has no adapter.
+
+        Returns:
+            list[tuple[Any, ...]]: Row tuples in ``fields`` order.
+        """
+        if self._adapter is None:
+            raise NoAdapterError("No adapter set for query")
+        sql, params = self._build_query(select=", ".join(_column_sql(f) for f in fields))
+        return [tuple(row) for row in self._adapter.execute(sql, params).fetchall()]
+
+    def pluck(self, field: str) -> list[Any]:
+        """Execute and return a single field per row as a flat list.
+
+        SQLite folds the matches into one ``json_group_array`` value, so a large
+        result crosses into Python as a single string decoded once, instead of
+        one row per match. Values come back as :meth:`values` returns them.
+
+        Args:
+            field: Column or dotted JSON field name, e.g. ``"name"``.
+
+        Raises:
+            NoAdapterError: If the query has no adapter.
+
+        Returns:
+            list[Any]: One value per matching row, in query order.
+        """
+        if self._adapter is None:
+            raise NoAdapterError("No adapter set for query")
+        sql, params = self._build_query(select=f"{_column_sql(field)} AS v")
+        cur = self._adapter.execute(f"SELECT json_group_array(v) FROM ({sql})", params)
+        return json.loads(cur.fetchone()[0])
+
     def first_dict(self) -> Optional[dict[str, Any]]:
         """Execute with ``LIMIT 1`` and return first parsed dict with ``_id``.
 
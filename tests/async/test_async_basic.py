@@ -1,6 +1,7 @@
 import pytest
 from sqler.query import SQLerField as F
 from sqler.query.async_query import AsyncSQLerQuery
+from sqler.query.query import InvariantViolationError
 
 
 @pytest.mark.asyncio
@@ -23,3 +24,13 @@ async def test_async_db_insert_find_and_query(async_db):  # use fixture
     q = AsyncSQLerQuery("users", adapter=async_db.adapter).filter(F("age") >= 30)
     rows = await q.all_dicts()
     assert rows and rows[0]["name"] == "Ada"
+
+
+@pytest.mark.asyncio
+async def test_async_all_parsed_rejects_null_data(async_adapter):
+    await async_adapter.execute("CREATE TABLE docs (_id INTEGER PRIMARY KEY, data JSON)")
+    await async_adapter.execute("INSERT INTO docs (data) VALUES (json(?)), (NULL)", ['{"a":1}'])
+    q = AsyncSQLerQuery("docs", adapter=async_adapter)
+    with pytest.raises(InvariantViolationError):
+        await q.all_parsed()
+    assert await q.filter(F("a") == 1).all_parsed() == [{"a": 1}]
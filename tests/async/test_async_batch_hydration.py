@@ -39,3 +39,5 @@ async def test_async_batch_hydration(async_db: AsyncSQLerDB, monkeypatch):
     users = await AUser.query().order_by("name").all()
     assert counter["address_in"] <= 1
     assert users and users[0].address is not None
+    # every document gets the shared payload, not just the first one referencing it
+    assert all(u.address.city in {"Kyoto", "Osaka", "Tokyo"} for u in users)
@@ -50,3 +50,16 @@ async def test_async_safe_query_and_refresh(async_db):
         assert first._version >= 0
     finally:
         ACustomer.set_db(None)
+
+
+@pytest.mark.asyncio
+async def test_async_safe_from_ids_carries_version(async_db):
+    ACustomer.set_db(async_db)
+    a = await ACustomer(name="A", tier=1).save()
+    b = await ACustomer(name="B", tier=1).save()
+    a.tier = 2
+    await a.save()
+
+    got = await ACustomer.from_ids([b._id, a._id])
+    assert [c.name for c in got] == ["B", "A"]
+    assert [c._version for c in got] == [0, 1]
@@ -0,0 +1,50 @@
+"""Shared PRAGMA bundles for the perf fixtures.
+
+Appending to ``adapter.pragmas`` (not just executing once) matters for on-disk
+DBs: worker threads open their own connections and must get the same settings.
+"""
+
+from sqler import SQLerDB
+
+MEMORY_PRAGMAS = (
+    # WAL is moot for :memory:; keep the journal in RAM and skip syncing entirely
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+)
+
+DISK_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA wal_autocheckpoint = 1000",
+)
+
+
+def apply_pragmas(db: SQLerDB) -> SQLerDB:
+    """Apply the bundle matching ``db``'s storage, now and on future connections."""
+    adapter = db.adapter
+    bundle = MEMORY_PRAGMAS if ":memory:" in str(adapter.path) else DISK_PRAGMAS
+    for pragma in bundle:
+        if pragma not in adapter.pragmas:
+            adapter.pragmas.append(pragma)
+        adapter.execute(pragma)
+    adapter.commit()
+    return db
+
+
+def analyze(db: SQLerDB) -> SQLerDB:
+    """Gather planner stats after seeding, as a long-lived app connection would.
+
+    ``analysis_limit`` caps how many rows ANALYZE samples per index.
+    """
+    adapter = db.adapter
+    adapter.execute("PRAGMA analysis_limit = 400")
+    adapter.execute("ANALYZE")
+    adapter.execute("PRAGMA optimize")
+    adapter.commit()
+    return db
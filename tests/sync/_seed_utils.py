@@ -0,0 +1,28 @@
+"""Seeding helpers for tests that need thousands of rows."""
+
+import json
+
+from sqler import SQLerDB
+
+
+def seed_nested_series(db: SQLerDB, table: str, count: int, keys) -> None:
+    """Generate ``count`` nested docs inside SQLite with one ``INSERT ... SELECT``.
+
+    Doc ``i`` is ``{keys[0]: {...{keys[-1]: {"myval": i, "array": [i, i % 100]}}},
+    "sample_name": "SAMPLE_i"}``: a fixed shell filled in by ``json_set`` per row.
+    A recursive CTE stands in for ``generate_series``, which the stock sqlite3
+    module does not ship.
+    """
+    shell = None
+    for key in reversed(keys):
+        shell = {key: shell}
+    template = json.dumps({**shell, "sample_name": None}, separators=(",", ":"))
+    db.adapter.execute(
+        "WITH RECURSIVE series(value) AS "
+        "(SELECT 0 UNION ALL SELECT value + 1 FROM series WHERE value + 1 < ?) "
+        f"INSERT INTO {table} (data) SELECT json_set(?, "
+        "?, json_object('myval', value, 'array', json_array(value, value % 100)), "
+        "'$.sample_name', 'SAMPLE_' || value) FROM series",
+        [count, template, "$." + ".".join(keys)],
+    )
+    db.adapter.commit()
@@ -1,16 +1,39 @@
-import json
+import shutil
 
 import pytest
+from _seed_utils import seed_nested_series
 from sqler import SQLerDB, SQLiteAdapter
 from sqler.adapter.abstract import AdapterABC
+from sqler.db.sqler_db import _dumps
 
 
 class DummyAdapter(AdapterABC):
     def __init__(self):
         self.executed = []
-        self.return_value = []  # set the raw dicts or lists or values
+        self.set_return_value([])
         self.count = 0
 
+    @property
+    def return_value(self):
+        return self._return_value
+
+    @return_value.setter
+    def return_value(self, rows):
+        self.set_return_value(rows)
+
+    def set_return_value(self, rows):
+        """Set the raw dicts (or values) to return, encoding both row shapes once."""
+        self._return_value = rows
+        # SELECT _id, data: the id split out of dict rows
+        self._two_col = [
+            (i.get("_id"), _dumps({k: v for k, v in i.items() if k != "_id"}))
+            if isinstance(i, dict)
+            else (None, _dumps(i))
+            for i in rows
+        ]
+        # SELECT data: the whole value as a single JSON string
+        self._one_col = [(_dumps(i),) for i in rows]
+
     def connect(self) -> None:
         pass
 
@@ -19,24 +42,20 @@ class DummyAdapter(AdapterABC):
 
     def execute(self, query: str, params=None):
         self.executed.append((query, params))
+        two_col = query.lstrip()[:16].lower() == "select _id, data"
 
         class Cursor:
+            arraysize = 1
+            _pos = 0
+
             def fetchall(cur_self):
-                # Support both SELECT data (single column) and SELECT _id, data (two columns)
-                lower_q = query.strip().lower()
-                if lower_q.startswith("select _id, data"):
-                    to_return = []
-                    for i in self.return_value:
-                        _id = i.get("_id") if isinstance(i, dict) else None
-                        if isinstance(i, dict) and "_id" in i:
-                            payload = {k: v for k, v in i.items() if k != "_id"}
-                        else:
-                            payload = i
-                        to_return.append((_id, json.dumps(payload)))
-                    return to_return
-                else:
-                    # default single-column JSON string
-                    return [(json.dumps(i),) for i in self.return_value]
+                return list(self._two_col if two_col else self._one_col)
+
+            def fetchmany(cur_self, size=None):
+                rows = self._two_col if two_col else self._one_col
+                end = cur_self._pos + (size or cur_self.arraysize)
+                batch, cur_self._pos = rows[cur_self._pos : end], end
+                return batch
 
             def fetchone(cur_self):
                 return (self.count,)
@@ -64,6 +83,12 @@ def dummy_adapter():
     return DummyAdapter()
 
 
+@pytest.fixture
+def json_dumps():
+    """The encoder ``DummyAdapter`` uses for the JSON text it hands back."""
+    return _dumps
+
+
 @pytest.fixture(scope="function")
 def oligo_adapter():
     adapter = SQLiteAdapter.in_memory(shared=False)
@@ -90,3 +115,33 @@ def oligo_db():
     yield db
 
     db.close()
+
+
+# 20-deep nesting; the last level holds {"myval": i, "array": [i, i % 100]}
+DEEP_KEYS = [f"level{i}" for i in range(1, 21)]
+DEEP_COUNT = 10_000
+
+
+@pytest.fixture(scope="session")
+def deep_oligo_template(tmp_path_factory):
+    """Seed the deeply nested oligos once per session and snapshot them to a file."""
+    path = tmp_path_factory.mktemp("deep") / "deep.sqlite"
+    db = SQLerDB.in_memory(shared=False)
+    db._ensure_table("oligos")
+    # the docs are generated inside SQLite: no per-row Python objects or bindings
+    seed_nested_series(db, "oligos", DEEP_COUNT, DEEP_KEYS)
+    db.adapter.execute("VACUUM INTO ?", [str(path)])
+    db.close()
+    return path
+
+
+@pytest.fixture(scope="function")
+def deep_oligo_db(deep_oligo_template, tmp_path):
+    """A private copy of the deep oligo snapshot: a file copy instead of 10k inserts."""
+    path = tmp_path / "deep.sqlite"
+    shutil.copyfile(deep_oligo_template, path)
+    db = SQLerDB.on_disk(str(path))
+
+    yield db
+
+    db.close()
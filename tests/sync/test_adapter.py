@@ -142,3 +142,37 @@ def test_context_manager_rollback_on_exception(tmp_path):
     adapter2.connect()
     cursor = adapter2.execute("SELECT COUNT(*) FROM foo;")
     assert cursor.fetchone()[0] == 0
+
+
+def test_begin_batches_writes_until_commit(tmp_path):
+    """begin() holds writes in one transaction; commit() ends it"""
+    path = str(tmp_path / "begin.db")
+    adapter = SQLiteAdapter(path)
+    adapter.connect()
+    adapter.execute("CREATE TABLE b(x INTEGER);")
+    adapter.commit()
+    adapter.begin("IMMEDIATE")
+    for i in range(3):
+        adapter.execute("INSERT INTO b(x) VALUES (?);", [i])
+    adapter.begin()  # already in a transaction: no-op
+    with pytest.raises(OperationalError):
+        adapter.begin("IMMEDIATE")  # can't promise the write lock mid-transaction
+    other = SQLiteAdapter(path)
+    other.connect()
+    assert other.execute("SELECT COUNT(*) FROM b;").fetchone()[0] == 0
+    adapter.commit()
+    assert other.execute("SELECT COUNT(*) FROM b;").fetchone()[0] == 3
+    other.close()
+    adapter.close()
+
+
+def test_with_block_commits_single_memory_connection():
+    """a ':memory:' adapter's one connection is committed by the with block too"""
+    adapter = SQLiteAdapter(":memory:")
+    adapter.connect()
+    adapter.execute("CREATE TABLE w(x INTEGER);")
+    with adapter:
+        adapter.execute("INSERT INTO w(x) VALUES (1);")
+        assert adapter._conn().in_transaction
+    assert not adapter._conn().in_transaction
+    adapter.close()
@@ -1,5 +1,10 @@
+import re
+
 from sqler import SQLerDB
-from sqler.models import SQLerModel
+from sqler.models import SQLerModel, as_ref
+
+# batched ref lookup, e.g. "SELECT _id, data, ? FROM address WHERE _id IN (?, ?)"
+_ADDR_IN_RE = re.compile(r"\s*select _id, data\b[^;]*? from address where _id in \(", re.I)
 
 
 class Address(SQLerModel):
@@ -20,27 +25,68 @@ def test_batch_hydration_reduces_fetches(monkeypatch):
     a2 = Address(city="Osaka").save()
     a3 = Address(city="Tokyo").save()
 
-    # 200 users referencing 3 addresses
-    for i in range(200):
-        addr = [a1, a2, a3][i % 3]
-        User(name=f"U{i}", address=addr).save()
+    # 200 users referencing 3 addresses, seeded in one bulk call
+    refs = [as_ref(a) for a in (a1, a2, a3)]
+    db.bulk_upsert("users", [{"name": f"U{i}", "address": refs[i % 3]} for i in range(200)])
 
     # instrument adapter to count address selects
     original_execute = db.adapter.execute
     counter = {"address_selects": 0}
+    batch_sql: list[str] = []
 
     def wrapped_execute(sql, params=None):
-        if (
-            sql.strip().lower().startswith("select _id, data from address")
-            and " in (" in sql.lower()
-        ):
+        if _ADDR_IN_RE.match(sql):
             counter["address_selects"] += 1
+            batch_sql.append(sql)
         return original_execute(sql, params)
 
     monkeypatch.setattr(db.adapter, "execute", wrapped_execute)
 
     users = User.query().order_by("name").all()
-    # expect at most 1 batched select per table
-    assert counter["address_selects"] <= 1
+    # expect exactly 1 batched select per table
+    assert counter["address_selects"] == 1
     # ensure hydrated
     assert isinstance(users[0].address, Address)
+
+    # ids are bound as one JSON array: same SQL text for 1 or 3 referenced rows
+    one = User.query().order_by("name").limit(1).all()
+    assert one[0].address.city == "Kyoto"
+    assert len(batch_sql) == 2 and batch_sql[0] == batch_sql[1]
+
+
+class Tag(SQLerModel):
+    label: str
+
+
+class Post(SQLerModel):
+    title: str
+    address: Address | None = None
+    tags: list[Tag] = []
+
+
+def test_batch_hydration_single_query_across_tables(monkeypatch):
+    db = SQLerDB.in_memory(shared=False)
+    for cls in (Address, Tag, Post):
+        cls.set_db(db)
+
+    a = Address(city="Nara").save()
+    tags = [Tag(label=f"t{i}").save() for i in range(3)]
+    for i in range(10):
+        Post(title=f"P{i}", address=a, tags=tags[: i % 4]).save()
+
+    original_execute = db.adapter.execute
+    in_selects: list[str] = []
+
+    def wrapped_execute(sql, params=None):
+        if " in (" in sql.lower():
+            in_selects.append(sql)
+        return original_execute(sql, params)
+
+    monkeypatch.setattr(db.adapter, "execute", wrapped_execute)
+
+    posts = Post.query().order_by("title").all()
+    # addresses and tags come back in one UNION ALL round-trip
+    assert len(in_selects) == 1
+    assert "UNION ALL" in in_selects[0]
+    assert posts[3].address.city == "Nara"
+    assert [t.label for t in posts[3].tags] == ["t0", "t1", "t2"]
@@ -67,5 +67,32 @@ def test_chaining_expressions():
     d = SQLerExpression(IS_SQL)
 
     expression = ((a | b) & c) & ~d
-    assert expression.sql == f"((({LEN_SQL}) OR ({TM_SQL})) AND ({LIKE_SQL})) AND (NOT ({IS_SQL}))"
+    # the side holding the LIKE is moved after the cheap NOT check
+    assert expression.sql == f"(NOT ({IS_SQL})) AND ((({LEN_SQL}) OR ({TM_SQL})) AND ({LIKE_SQL}))"
     assert expression.params == [20, 50, "TTT%"]
+
+
+def test_cheaper_predicates_go_first():
+    """comparisons before LIKE before json_each subqueries; params follow their sql"""
+    like = SQLerExpression(LIKE_SQL, ["A%"])
+    length = SQLerExpression(LEN_SQL, [5])
+    each = SQLerExpression("EXISTS (SELECT 1 FROM json_each(data, '$.tags') WHERE value = ?)", [1])
+    assert (like & length).sql == f"({LEN_SQL}) AND ({LIKE_SQL})"
+    assert (like & length).params == [5, "A%"]
+    assert (each | like).sql == f"({LIKE_SQL}) OR ({each.sql})"
+    assert (each | like).params == ["A%", 1]
+    # equal cost keeps the written order
+    assert (length & SQLerExpression(TM_SQL, [1])).sql == f"({LEN_SQL}) AND ({TM_SQL})"
+
+
+def test_combining_subclassed_expressions():
+    """any() builds a subclass; combining it yields a plain expression"""
+    from sqler.query import SQLerField as F
+
+    any_expr = F("arr").any()["val"] == 1
+    combined = ~(any_expr & (F("x") == 2))
+    assert type(combined) is SQLerExpression
+    assert combined.sql.startswith("NOT ((JSON_EXTRACT(data, '$.x') = ?) AND (EXISTS (SELECT 1")
+    assert combined.params == [2, 1]
+    # slotted: no per-instance __dict__
+    assert not hasattr(combined, "__dict__")
@@ -49,6 +49,25 @@ def test_contains_isin_sql_array():
     assert expr3.params == ["exon%"]
 
 
+def test_any_walks_arrays_without_extracting_them():
+    """any() hands the path to json_each instead of json_extract-ing a copy first"""
+    expr = SQLerField(["level1"]).any()["arr2"].any()["val"] > 0
+    assert expr.sql == (
+        "EXISTS (SELECT 1 FROM json_each(data, '$.level1') AS a "
+        "JOIN json_each(a.value, '$.arr2') AS b "
+        "WHERE json_extract(b.value, '$.val') > ?)"
+    )
+    assert expr.params == [0]
+
+
+def test_json_path_quoting_and_indexes():
+    """odd keys get quoted, ints become [n]; same path renders the same text"""
+    f = SQLerField(["meta", "odd key", 2, 'say "hi"'])
+    assert f._json_path() == '$.meta."odd key"[2]."say \\"hi\\""'
+    assert SQLerField([])._json_path() == "$"
+    assert SQLerField("meta")["odd key"][2]['say "hi"']._json_path() is f._json_path()
+
+
 def test_fields_make_the_same_way():
     """make sure the paths are working because why not"""
     seq = SQLerField("sequence")
@@ -146,3 +165,27 @@ def test_contains_isin_real_integration(oligo_db):
     docs = [d for d in results]
     seqs = {d["sequence"] for d in docs}
     assert seqs == {"ACGTACGTACGTACGTAC", "CGTAAAGGGTTTCCCAAAGG"}
+
+
+def test_prefix_like_becomes_ranges(oligo_db):
+    """short prefix LIKE is rewritten to index-friendly ranges with the same matches"""
+    name = SQLerField("name")
+    expr = name.like("B%")
+    assert "LIKE" not in expr.sql
+    assert expr.params == ["B", "C", "b", "c"]
+    # wildcards inside the pattern or a numeric-looking prefix keep LIKE
+    assert name.like("B_%").sql.endswith("LIKE ?")
+    assert name.like("1%").sql.endswith("LIKE ?")
+
+    for value in ["Bob", "bea", "B", "Carl", "abby", "", 12, None, ["B"]]:
+        oligo_db.insert_document("oligos", {"name": value})
+    for pattern in ["B%", "b%", "Bo%", "é%", "B-%"]:
+        expr = name.like(pattern)
+        got = oligo_db.adapter.execute(
+            f"SELECT _id FROM oligos WHERE {expr.sql} ORDER BY _id", expr.params
+        ).fetchall()
+        want = oligo_db.adapter.execute(
+            "SELECT _id FROM oligos WHERE json_extract(data, '$.name') LIKE ? ORDER BY _id",
+            [pattern],
+        ).fetchall()
+        assert [r[0] for r in got] == [r[0] for r in want], pattern
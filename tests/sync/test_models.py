@@ -1,3 +1,5 @@
+import json
+
 from sqler import SQLerDB
 from sqler.models import SQLerModel
 from sqler.query import SQLerField as F
@@ -80,3 +82,92 @@ def test_model_add_index():
         User.add_index("age")
     finally:
         db.close()
+
+
+def test_model_from_ids_single_query(monkeypatch):
+    db = setup_db()
+    try:
+        ids = [User(name=n, age=i).save()._id for i, n in enumerate(["A", "B", "C"])]
+
+        calls = []
+        original_execute = db.adapter.execute
+
+        def wrapped_execute(sql, params=None):
+            if sql.lstrip().upper().startswith("SELECT"):
+                calls.append(sql)
+            return original_execute(sql, params)
+
+        monkeypatch.setattr(db.adapter, "execute", wrapped_execute)
+
+        # input order is preserved, duplicates kept, missing ids skipped
+        got = User.from_ids([ids[2], 999, ids[0], ids[2]])
+        assert [u.name for u in got] == ["C", "A", "C"]
+        assert all(u._id is not None for u in got)
+        assert len(calls) == 1
+        assert User.from_ids([]) == []
+    finally:
+        db.close()
+
+
+def test_queryset_values_returns_tuples():
+    db = setup_db()
+    try:
+        User(name="B", age=2).save()
+        User(name="A", age=1).save()
+        rows = User.query().order_by("age").values("_id", "name", "age")
+        assert rows == [(2, "A", 1), (1, "B", 2)]
+    finally:
+        db.close()
+
+
+class TrustedUser(SQLerModel):
+    _trust_db = True
+    name: str
+    age: int
+
+
+def test_trusted_model_hydrates_without_validation():
+    db = SQLerDB.in_memory(shared=False)
+    TrustedUser.set_db(db)
+    try:
+        u = TrustedUser(name="A", age=1).save()
+        got = TrustedUser.from_id(u._id)
+        assert (got._id, got.name, got.age) == (u._id, "A", 1)
+        # stored documents are taken as-is: no coercion happens on load
+        db.adapter.execute(
+            "UPDATE trustedusers SET data = json_set(data, '$.age', '7') WHERE _id = ?", [u._id]
+        )
+        assert TrustedUser.query().all()[0].age == "7"
+        got.age = 2
+        got.save()
+        assert TrustedUser.from_id(u._id).model_dump() == {"name": "A", "age": 2}
+    finally:
+        db.close()
+
+
+class TrustedHome(SQLerModel):
+    city: str
+
+
+class TrustedResident(SQLerModel):
+    _trust_db = True
+    name: str
+    home: TrustedHome | None = None
+
+
+def test_trusted_model_still_builds_relations():
+    db = SQLerDB.in_memory(shared=False)
+    TrustedHome.set_db(db)
+    TrustedResident.set_db(db)
+    try:
+        home = TrustedHome(city="Kyoto").save()
+        TrustedResident(name="A", home=home).save()
+        got = TrustedResident.query().all()[0]
+        assert isinstance(got.home, TrustedHome) and got.home.city == "Kyoto"
+        # re-saving must keep the ref, not embed a copy of the address
+        got.name = "B"
+        got.save()
+        row = db.adapter.execute("SELECT data FROM trustedresidents").fetchone()
+        assert json.loads(row[0])["home"] == {"_table": "trustedhomes", "_id": home._id}
+    finally:
+        db.close()
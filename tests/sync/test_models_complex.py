@@ -1,3 +1,4 @@
+import pytest
 from sqler import SQLerDB
 from sqler.models import SQLerModel
 from sqler.query import SQLerField as F
@@ -9,11 +10,25 @@ class Product(SQLerModel):
     tags: list[str] | None = None
     items: list[dict] | None = None
 
+    class Meta:
+        indexed_fields = ["price"]
 
-def setup_db():
+
+@pytest.fixture(scope="module")
+def product_db():
+    """One DB per module: schema, indexes and set_db bookkeeping happen once."""
     db = SQLerDB.in_memory(shared=False)
     Product.set_db(db)
-    return db
+    yield db
+    db.close()
+
+
+@pytest.fixture
+def db(product_db):
+    """The module DB, emptied after each test (saves commit, so no SAVEPOINT)."""
+    yield product_db
+    product_db.adapter.execute("DELETE FROM products;")
+    product_db.adapter.commit()
 
 
 def seed(db):
@@ -34,36 +49,32 @@ def seed(db):
     ).save()
 
 
-def test_arrays_and_any_filters():
-    db = setup_db()
-    try:
-        seed(db)
-
-        # contains
-        p = Product.query().filter(F("tags").contains("electronics")).order_by("price").all()
-        assert [x.name for x in p] == ["Mouse", "Keyboard", "Laptop"]
-
-        # isin
-        p2 = Product.query().filter(F("tags").isin(["computers"])).all()
-        assert [x.name for x in p2] == ["Laptop"]
-
-        # any over array of objects: items[].qty > 3
-        p3 = Product.query().filter(F(["items"]).any()["qty"] > 3).order_by("price").all()
-        assert [x.name for x in p3] == ["Mouse"]
-
-        # complex boolean: (price>=50 & price<=100) & !like('M%')
-        cond = (F("price") >= 50) & (F("price") <= 100) & ~F("name").like("M%")
-        p4 = Product.query().filter(cond).all()
-        assert [x.name for x in p4] == ["Keyboard"]
-
-        # exclude + limit/desc
-        q = (
-            Product.query()
-            .exclude(F("tags").contains("accessories"))
-            .order_by("price", desc=True)
-            .limit(1)
-        )
-        first = q.first()
-        assert first.name == "Laptop"
-    finally:
-        db.close()
+def test_arrays_and_any_filters(db):
+    seed(db)
+
+    # contains
+    p = Product.query().filter(F("tags").contains("electronics")).order_by("price").all()
+    assert [x.name for x in p] == ["Mouse", "Keyboard", "Laptop"]
+
+    # isin
+    p2 = Product.query().filter(F("tags").isin(["computers"])).all()
+    assert [x.name for x in p2] == ["Laptop"]
+
+    # any over array of objects: items[].qty > 3
+    p3 = Product.query().filter(F(["items"]).any()["qty"] > 3).order_by("price").all()
+    assert [x.name for x in p3] == ["Mouse"]
+
+    # complex boolean: (price>=50 & price<=100) & !like('M%')
+    cond = (F("price") >= 50) & (F("price") <= 100) & ~F("name").like("M%")
+    p4 = Product.query().filter(cond).all()
+    assert [x.name for x in p4] == ["Keyboard"]
+
+    # exclude + limit/desc
+    q = (
+        Product.query()
+        .exclude(F("tags").contains("accessories"))
+        .order_by("price", desc=True)
+        .limit(1)
+    )
+    first = q.first()
+    assert first.name == "Laptop"
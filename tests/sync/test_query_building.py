@@ -79,14 +79,14 @@ def test_count_runs_adapter(query_obj):
     assert "count(*)" in adapter.executed[-1][0]
 
 
-def test_all_runs_adapter(query_obj):
+def test_all_runs_adapter(query_obj, json_dumps):
     """can we query .all()?"""
     q, adapter = query_obj
     expr = SQLerExpression("length > ?", [5])
     q = q.filter(expr)
     adapter.return_value = [{"sequence": "ACGTACGT", "length": 8}]
-    _ = q.all()
     # result is what DummyAdapter returned
+    assert q.all() == [json_dumps({"sequence": "ACGTACGT", "length": 8})]
     assert adapter.executed[-1][0].startswith("SELECT data")
 
 
@@ -113,3 +113,34 @@ def test_first_returns_none_if_empty(dummy_adapter):
     q = q.filter(expr)
     dummy_adapter.return_value = []
     assert q.first() is None
+
+
+def test_offset_builds_sql(query_obj):
+    """can we page with offset?"""
+    q, _ = query_obj
+    assert q.limit(10).offset(20).sql == "SELECT data FROM oligos LIMIT 10 OFFSET 20"
+    # OFFSET without LIMIT needs SQLite's "no limit" sentinel
+    assert q.offset(5).sql == "SELECT data FROM oligos LIMIT -1 OFFSET 5"
+
+
+def test_order_by_underscore_uses_column(query_obj):
+    """_-prefixed sort keys are real columns, not JSON paths"""
+    q, _ = query_obj
+    assert q.order_by("_id", desc=True).sql == "SELECT data FROM oligos ORDER BY _id DESC"
+
+
+def test_count_ignores_limit_and_offset(query_obj):
+    q, adapter = query_obj
+    adapter.count = 3
+    assert q.limit(2).offset(10).count() == 3
+    assert "OFFSET" not in adapter.executed[-1][0]
+
+
+def test_values_projects_columns_and_fields(query_obj):
+    q, adapter = query_obj
+    q.order_by("length").limit(2).values("_id", "sequence")
+    sql = adapter.executed[-1][0]
+    assert sql == (
+        "SELECT _id, json_extract(data, '$.sequence') FROM oligos "
+        "ORDER BY json_extract(data, '$.length') LIMIT 2"
+    )
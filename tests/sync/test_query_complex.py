@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 
 import pytest
 from sqler.query import SQLerField, SQLerQuery
@@ -47,9 +48,7 @@ def setup_oligos(oligo_db):
 def test_filter_length_gt(oligo_db, setup_oligos):
     length = SQLerField("length")
     q = SQLerQuery("oligos", oligo_db.adapter)
-    result = q.filter(length > 6).all()
-    oligos = [json.loads(row) for row in result]
-    seqs = {o["sequence"] for o in oligos}
+    seqs = {seq for (seq,) in q.filter(length > 6).values("sequence")}
     assert "AACCCGGGGTTTT" in seqs
     assert "GATTACA" in seqs
     assert "CCGGAA" not in seqs
@@ -60,8 +59,7 @@ def test_and_or_logic(oligo_db, setup_oligos):
     tag = SQLerField("tags")
     q = SQLerQuery("oligos", oligo_db.adapter)
     expr = ((length == 4) & tag.contains("short")) | (tag.contains("movie"))
-    rows = [json.loads(j) for j in q.filter(expr).all()]
-    seqs = {o["sequence"] for o in rows}
+    seqs = {seq for (seq,) in q.filter(expr).values("sequence")}
     # Should include "ACGT", "TTTT" (length 4 and short) and "GATTACA" (movie)
     assert "ACGT" in seqs
     assert "TTTT" in seqs
@@ -71,23 +69,20 @@ def test_and_or_logic(oligo_db, setup_oligos):
 def test_exclude_by_mass(oligo_db, setup_oligos):
     mass = SQLerField("mass")
     q = SQLerQuery("oligos", oligo_db.adapter)
-    result = q.exclude(mass == 0.0).all()
-    oligos = [json.loads(row) for row in result]
-    seqs = {o["sequence"] for o in oligos}
+    seqs = {seq for (seq,) in q.exclude(mass == 0.0).values("sequence")}
     assert "NNNN" not in seqs
     assert "ACGT" in seqs
 
 
 def test_order_by_tm_desc(oligo_db, setup_oligos):
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.order_by("tm", desc=True).all()]
-    tms = [o["tm"] for o in rows]
+    tms = [tm for (tm,) in q.order_by("tm", desc=True).values("tm")]
     assert tms == sorted(tms, reverse=True)
 
 
 def test_limit_two_shortest(oligo_db, setup_oligos):
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.order_by("length").limit(2).all()]
+    rows = q.order_by("length").limit(2).all_parsed()
     # All your short oligos have length 4
     assert all(o["length"] == 4 for o in rows)
     assert len(rows) == 2
@@ -106,8 +101,8 @@ def test_chained_queries_are_immutable(oligo_db, setup_oligos):
     q = SQLerQuery("oligos", oligo_db.adapter)
     q1 = q.filter(tag.contains("short"))
     q2 = q1.exclude(SQLerField("sequence") == "ACGT")
-    seqs1 = {json.loads(j)["sequence"] for j in q1.all()}
-    seqs2 = {json.loads(j)["sequence"] for j in q2.all()}
+    seqs1 = {seq for (seq,) in q1.values("sequence")}
+    seqs2 = {seq for (seq,) in q2.values("sequence")}
     assert "ACGT" in seqs1
     assert "ACGT" not in seqs2
 
@@ -117,12 +112,11 @@ def test_in_and_like(oligo_db, setup_oligos):
     q = SQLerQuery("oligos", oligo_db.adapter)
     # any sequence exactly one of these
     expr = seq.isin(["ACGT", "GATTACA"])
-    rows = [json.loads(j) for j in q.filter(expr).all()]
-    seqs = {o["sequence"] for o in rows}
+    seqs = {seq for (seq,) in q.filter(expr).values("sequence")}
     assert seqs == {"ACGT", "GATTACA"}
     # pattern matching
     expr2 = seq.like("A%")
-    rows2 = [json.loads(j) for j in q.filter(expr2).all()]
+    rows2 = q.filter(expr2).all_parsed()
     for o in rows2:
         assert o["sequence"].startswith("A")
 
@@ -131,11 +125,11 @@ def test_operator_precedence_docstring(oligo_db, setup_oligos):
     seq = SQLerField("sequence")
     q = SQLerQuery("oligos", oligo_db.adapter)
     expr = ((seq == "ACGT") & (seq == "TTTT")) | (seq == "AACCCGGGGTTTT")
-    rows = [json.loads(j) for j in q.filter(expr).all()]
+    rows = q.filter(expr).all_parsed()
     # Only the long one matches (the other AND is never true)
     assert rows[0]["sequence"] == "AACCCGGGGTTTT"
     expr2 = (seq == "ACGT") & ((seq == "TTTT") | (seq == "AACCCGGGGTTTT"))
-    rows2 = [json.loads(j) for j in q.filter(expr2).all()]
+    rows2 = q.filter(expr2).all_parsed()
     # Should be empty
     assert rows2 == []
 
@@ -144,7 +138,7 @@ def test_contains_on_array(oligo_db, setup_oligos):
     tags = SQLerField("tags")
     q = SQLerQuery("oligos", oligo_db.adapter)
     expr = tags.contains("test")
-    rows = [json.loads(j) for j in q.filter(expr).all()]
+    rows = q.filter(expr).all_parsed()
     assert any("test" in o["tags"] for o in rows)
 
 
@@ -194,91 +188,68 @@ def test_chained_any_levels_with_oligo_db(oligo_db):
     date = SQLerField(["reads"]).any()["date"]
     expression = date == "2025-07-10"
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expression).all()]
-    names = {r["sample_name"] for r in rows}
+    names = {name for (name,) in q.filter(expression).values("sample_name")}
     assert "NESTED" in names
     assert "CONTROL" not in names
 
     # Two levels: find any oligo with any read that has any mass with mz > 900
     mz = SQLerField(["reads"]).any()["masses"].any()["mz"]
     expression = mz > 900
-    rows = [json.loads(j) for j in q.filter(expression).all()]
-    names = {r["sample_name"] for r in rows}
+    names = {name for (name,) in q.filter(expression).values("sample_name")}
     assert "NESTED" in names
     assert "CONTROL" not in names
 
 
-def test_deeply_nested_contains_and_range(oligo_db):
-    """insert 10k docs with deep arrays, test contains(0) and range query at last level"""
+@lru_cache
+def _sample_names(start, stop, step=1):
+    """names of the deep_oligo_db docs with i in range(start, stop, step), built once"""
+    return frozenset(f"SAMPLE_{i}" for i in range(start, stop, step))
+
+
+def test_deeply_nested_contains_and_range(deep_oligo_db):
+    """10k docs with deep arrays (see deep_oligo_db): contains(0) and range query at last level"""
     count = 10000
     keys = [f"level{i}" for i in range(1, 21)]  # level1 ... level20
 
-    for i in range(count):
-        d = {}
-        ptr = d
-        for k in keys[:-1]:
-            ptr[k] = {}
-            ptr = ptr[k]
-        ptr[keys[-1]] = [i, i % 100]  # final array has deterministic values
-        d["sample_name"] = f"SAMPLE_{i}"
-        oligo_db.insert_document("oligos", d)
-
     # Query 1: find all with array containing 0 at final level
-    field = SQLerField(keys)
+    field = SQLerField(keys)["array"]
     expr = field.contains(0)
-    q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expr).all()]
-    found_names = {r["sample_name"] for r in rows}
-    expected_names = {f"SAMPLE_{i}" for i in range(0, count, 100)}
+    q = SQLerQuery("oligos", deep_oligo_db.adapter)
+    found_names = set(q.filter(expr).pluck("sample_name"))
+    expected_names = _sample_names(0, count, 100)
     assert found_names == expected_names
     assert len(found_names) == 100
 
     # Query 2: get all where i in [500, 599]
     # (because final array always includes i as first element)
-    expr = field[0] >= 500
-    q2 = SQLerQuery("oligos", oligo_db.adapter)
+    # q.filter() returned a new query above, so q itself is still unfiltered
     expr2 = (field[0] >= 500) & (field[0] < 600)
-    rows2 = [json.loads(j) for j in q2.filter(expr2).all()]
-    found_names2 = {r["sample_name"] for r in rows2}
-    expected_names2 = {f"SAMPLE_{i}" for i in range(500, 600)}
+    found_names2 = set(q.filter(expr2).pluck("sample_name"))
+    expected_names2 = _sample_names(500, 600)
     assert found_names2 == expected_names2
     assert len(found_names2) == 100
 
 
-def test_deeply_nested_index_and_key(oligo_db):
-    """insert 10k docs with 20-deep arrays, test [0] and ['thekey'] querying at last level"""
-
-    count = 10000
+def test_deeply_nested_index_and_key(deep_oligo_db):
+    """10k docs 20 levels deep (see deep_oligo_db): [0] and ['thekey'] querying at last level"""
     keys = [f"level{i}" for i in range(1, 21)]  # level1 ... level20
 
-    # Each doc: deepest level is a dict with a key 'myval' and a list [i, i % 100]
-    for i in range(count):
-        d = {}
-        ptr = d
-        for k in keys[:-1]:
-            ptr[k] = {}
-            ptr = ptr[k]
-        ptr[keys[-1]] = {"myval": i, "array": [i, i % 100]}
-        d["sample_name"] = f"SAMPLE_{i}"
-        oligo_db.insert_document("oligos", d)
+    # build the 20-level base once; both fields below branch off it
+    leaf = SQLerField(keys)
 
     # Query 1: final_level['myval'] < 600 (dict access)
-    field = SQLerField(keys)["myval"]
-    expr = field < 600
-    q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expr).all()]
-    found_names = {r["sample_name"] for r in rows}
-    expected_names = {f"SAMPLE_{i}" for i in range(600)}
+    expr = leaf["myval"] < 600
+    q = SQLerQuery("oligos", deep_oligo_db.adapter)
+    found_names = set(q.filter(expr).pluck("sample_name"))
+    expected_names = _sample_names(0, 600)
     assert found_names == expected_names
     assert len(found_names) == 600
 
     # Query 2: final_level['array'][0] >= 500 and < 600 (array access)
-    arr_field = SQLerField(keys)["array"][0]
+    arr_field = leaf["array"][0]
     expr2 = (arr_field >= 500) & (arr_field < 600)
-    q2 = SQLerQuery("oligos", oligo_db.adapter)
-    rows2 = [json.loads(j) for j in q2.filter(expr2).all()]
-    found_names2 = {r["sample_name"] for r in rows2}
-    expected_names2 = {f"SAMPLE_{i}" for i in range(500, 600)}
+    found_names2 = set(q.filter(expr2).pluck("sample_name"))
+    expected_names2 = _sample_names(500, 600)
     assert found_names2 == expected_names2
     assert len(found_names2) == 100
 
@@ -293,7 +264,7 @@ def test_simple_field_gt(oligo_db):
     oligo_db.insert_document("oligos", {"count": 12})
     expr = SQLerField("count") > 5
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expr).all()]
+    rows = q.filter(expr).all_parsed()
     assert [r["count"] for r in rows] == [12]
 
 
@@ -306,7 +277,7 @@ def test_nested_field_le(oligo_db):
     oligo_db.insert_document("oligos", doc2)
     expr = SQLerField(["meta", "info", "score"]) <= 100
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expr).all()]
+    rows = q.filter(expr).all_parsed()
     assert rows[0]["meta"]["info"]["score"] == 90
 
 
@@ -318,7 +289,7 @@ def test_alternative_syntax_ne(oligo_db):
     oligo_db.insert_document("oligos", doc1)
     oligo_db.insert_document("oligos", doc2)
     f = SQLerField("meta") / "info" / "score"
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(f != 0).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(f != 0).all_parsed()
     assert rows[0]["meta"]["info"]["score"] == 5
 
 
@@ -329,7 +300,7 @@ def test_contains_array_primitives(oligo_db):
     oligo_db.insert_document("oligos", {"tags": ["green"]})
     expr = SQLerField("tags").contains("blue")
     q = SQLerQuery("oligos", oligo_db.adapter)
-    rows = [json.loads(j) for j in q.filter(expr).all()]
+    rows = q.filter(expr).all_parsed()
     assert rows[0]["tags"] == ["red", "blue"]
 
 
@@ -339,7 +310,7 @@ def test_isin_array_primitives(oligo_db):
     oligo_db.insert_document("oligos", {"tags": [1, 2, 3]})
     oligo_db.insert_document("oligos", {"tags": [4, 5]})
     expr = SQLerField("tags").isin([3, 5])
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     names = [r["tags"] for r in rows]
     assert [[1, 2, 3], [4, 5]][0] in names  # both match one of the list
 
@@ -350,7 +321,7 @@ def test_like_string(oligo_db):
     oligo_db.insert_document("oligos", {"name": "ABC123"})
     oligo_db.insert_document("oligos", {"name": "XYZ"})
     expr = SQLerField("name").like("ABC%")
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows[0]["name"] == "ABC123"
 
 
@@ -359,7 +330,7 @@ def test_index_array_primitives(oligo_db):
     """access array index 0"""
     oligo_db.insert_document("oligos", {"tags": ["first", "second"]})
     expr = SQLerField("tags")[0] == "first"
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows[0]["tags"][0] == "first"
 
 
@@ -368,7 +339,7 @@ def test_any_one_level(oligo_db):
     """any() on array of dicts"""
     oligo_db.insert_document("oligos", {"peaks": [{"mz": 800}, {"mz": 950}]})
     expr = SQLerField(["peaks"]).any()["mz"] > 900
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows[0]["peaks"][1]["mz"] == 950
 
 
@@ -378,7 +349,7 @@ def test_any_two_levels(oligo_db):
     doc = {"reads": [{"masses": [{"mz": 910}, {"mz": 880}]}]}
     oligo_db.insert_document("oligos", doc)
     expr = SQLerField(["reads"]).any()["masses"].any()["mz"] > 900
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows and rows[0]["reads"][0]["masses"][0]["mz"] == 910
 
 
@@ -388,7 +359,7 @@ def test_deeply_nested_dict(oligo_db):
     d = {"a": {"b": {"c": {"d": 42}}}}
     oligo_db.insert_document("oligos", d)
     expr = SQLerField(["a", "b", "c", "d"]) == 42
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows[0]["a"]["b"]["c"]["d"] == 42
 
 
@@ -398,7 +369,7 @@ def test_combined_filters(oligo_db):
     oligo_db.insert_document("oligos", {"count": 5})
     oligo_db.insert_document("oligos", {"count": 15})
     expr = (SQLerField("count") >= 10) & (SQLerField("count") < 20)
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert rows[0]["count"] == 15
 
 
@@ -441,6 +412,16 @@ def test_mid_chain_filter_on_nested_array(oligo_db):
         SQLerField(["reads"]).any().where(SQLerField(["note"]) == "good")["masses"].any()["val"]
         > 10
     )
-    rows = [json.loads(j) for j in SQLerQuery("oligos", oligo_db.adapter).filter(expr).all()]
+    rows = SQLerQuery("oligos", oligo_db.adapter).filter(expr).all_parsed()
     assert len(rows) == 1
     assert rows[0]["sample_name"] == "MIXED"
+
+
+def test_pluck_matches_values(oligo_db):
+    """pluck() returns the values() column as one flat list, in query order"""
+    for i, name in enumerate(["c", "a", "b"]):
+        oligo_db.insert_document("oligos", {"name": name, "n": i, "tags": [i]})
+    q = SQLerQuery("oligos", oligo_db.adapter).order_by("name").limit(2)
+    assert q.pluck("name") == ["a", "b"]
+    assert q.pluck("tags") == [v for (v,) in q.values("tags")]
+    assert q.filter(SQLerField("n") > 5).pluck("name") == []
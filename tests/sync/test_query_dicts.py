@@ -1,4 +1,7 @@
-from sqler.query import SQLerQuery
+import pytest
+from sqler.adapter import SQLiteAdapter
+from sqler.query import SQLerExpression, SQLerQuery
+from sqler.query.query import InvariantViolationError
 
 
 def test_all_dicts_returns_parsed_with_id(dummy_adapter):
@@ -29,3 +32,15 @@ def test_first_dict_limits_and_returns_none(dummy_adapter):
     assert doc == {"_id": 10, "name": "Zoe"}
     # Should have used LIMIT 1
     assert any("LIMIT 1" in stmt[0] for stmt in dummy_adapter.executed)
+
+
+def test_all_parsed_rejects_null_data():
+    adapter = SQLiteAdapter.in_memory(shared=False)
+    adapter.connect()
+    adapter.execute("CREATE TABLE docs (_id INTEGER PRIMARY KEY, data JSON)")
+    adapter.execute("INSERT INTO docs (data) VALUES (json(?)), (NULL)", ['{"a":1}'])
+    q = SQLerQuery(table="docs", adapter=adapter)
+    with pytest.raises(InvariantViolationError):
+        q.all_parsed()
+    assert q.filter(SQLerExpression("data IS NOT NULL")).all_parsed() == [{"a": 1}]
+    adapter.close()
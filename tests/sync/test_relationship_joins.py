@@ -13,6 +13,9 @@ class User(SQLerModel):
     name: str
     address: Address | None = None
 
+    class Meta:
+        indexed_fields = ["name"]
+
 
 def test_relationship_join_exists_query():
     db = SQLerDB.in_memory(shared=False)
@@ -1,3 +1,5 @@
+import json
+
 from sqler import SQLerDB
 from sqler.models import SQLerModel
 
@@ -11,6 +13,9 @@ class User(SQLerModel):
     name: str
     address: Address | None = None
 
+    class Meta:
+        indexed_fields = ["name"]
+
 
 def test_relationship_save_load_refresh():
     db = SQLerDB.in_memory(shared=False)
@@ -38,3 +43,23 @@ def test_relationship_save_load_refresh():
     assert loaded.address.city == "Osaka"
 
     db.close()
+
+
+def test_queried_relation_saves_back_as_ref():
+    db = SQLerDB.in_memory(shared=False)
+    Address.set_db(db)
+    User.set_db(db)
+
+    addr = Address(city="Kyoto", country="JP").save()
+    User(name="Alice", address=addr).save()
+
+    # query().all() hydrates the address in a batch; its id must survive validation
+    loaded = User.query().all()[0]
+    assert loaded.address._id == addr._id
+    loaded.name = "Alicia"
+    loaded.save()
+
+    row = db.adapter.execute("SELECT data FROM users").fetchone()
+    assert json.loads(row[0])["address"] == {"_table": Address.__tablename__, "_id": addr._id}
+
+    db.close()
@@ -1,3 +1,4 @@
+import pytest
 from sqler import SQLerDB
 from sqler.models import SQLerSafeModel, StaleVersionError
 from sqler.query import SQLerField as F
@@ -7,89 +8,98 @@ class Customer(SQLerSafeModel):
     name: str
     tier: int
 
+    class Meta:
+        indexed_fields = ["name", "tier"]
 
-def setup_db():
+
+@pytest.fixture(scope="module")
+def customer_db():
+    """One DB per module: schema, indexes and set_db bookkeeping happen once."""
     db = SQLerDB.in_memory(shared=False)
     Customer.set_db(db)
-    return db
+    yield db
+    db.close()
 
 
-def test_safe_model_insert_sets_version_zero():
-    db = setup_db()
-    try:
-        c = Customer(name="Alice", tier=1)
-        c.save()
-        assert c._id is not None
-        assert c._version == 0
+@pytest.fixture
+def db(customer_db):
+    """The module DB, emptied after each test.
 
-        # bump via update
-        c.tier = 2
-        c.save()
-        assert c._version == 1
-    finally:
-        db.close()
+    Model saves commit on their own, so a wrapping SAVEPOINT would be released
+    by the first save; clearing the table is the cheap equivalent.
+    """
+    yield customer_db
+    customer_db.adapter.execute("DELETE FROM customers;")
+    customer_db.adapter.commit()
 
 
-def test_safe_model_stale_update_raises():
-    db = setup_db()
-    try:
-        c = Customer(name="Bob", tier=1)
-        c.save()
+def test_safe_model_insert_sets_version_zero(db):
+    c = Customer(name="Alice", tier=1)
+    c.save()
+    assert c._id is not None
+    assert c._version == 0
 
-        # simulate concurrent update: bump version behind the model's back
-        db.adapter.execute("UPDATE customers SET _version = _version + 1 WHERE _id = ?;", [c._id])
-        db.adapter.commit()
+    # bump via update
+    c.tier = 2
+    c.save()
+    assert c._version == 1
 
-        c.tier = 3
-        try:
-            c.save()
-            assert False, "Expected StaleVersionError"
-        except StaleVersionError:
-            pass
-    finally:
-        db.close()
 
+def test_safe_model_stale_update_raises(db):
+    c = Customer(name="Bob", tier=1)
+    c.save()
 
-def test_safe_model_refresh_reads_version():
-    db = setup_db()
+    # simulate concurrent update: bump version behind the model's back
+    db.adapter.executescript(
+        f"BEGIN; UPDATE customers SET _version = _version + 1 WHERE _id = {c._id:d}; COMMIT;"
+    )
+
+    c.tier = 3
     try:
-        c = Customer(name="Zoe", tier=1)
         c.save()
-        assert c._version == 0
+        assert False, "Expected StaleVersionError"
+    except StaleVersionError:
+        pass
 
-        # bump version via raw SQL
-        db.adapter.execute(
-            "UPDATE customers SET _version = _version + 1, data = json_set(data, '$.tier', 5) WHERE _id = ?;",
-            [c._id],
-        )
-        db.adapter.commit()
 
-        c.refresh()
-        assert c._version == 1
-        assert c.tier == 5
-    finally:
-        db.close()
+def test_safe_model_refresh_reads_version(db):
+    c = Customer(name="Zoe", tier=1)
+    c.save()
+    assert c._version == 0
 
+    # bump version via raw SQL
+    db.adapter.executescript(
+        "BEGIN; UPDATE customers SET _version = _version + 1, "
+        f"data = json_set(data, '$.tier', 5) WHERE _id = {c._id:d}; COMMIT;"
+    )
 
-def test_safe_model_complex_filters():
-    db = setup_db()
-    try:
-        Customer(name="A", tier=1).save()
-        Customer(name="B", tier=2).save()
-        Customer(name="C", tier=3).save()
-
-        # complex: (tier>=2) & name like 'B%'
-        qs = Customer.query().filter((F("tier") >= 2) & F("name").like("B%"))
-        res = qs.all()
-        assert [c.name for c in res] == ["B"]
-
-        # order + limit
-        first = Customer.query().order_by("tier", desc=True).limit(1).first()
-        assert first.name == "C"
-
-        # version present only after refresh/from_id
-        assert getattr(first, "_version", None) == 0  # default until refresh
-        first.refresh()
-        assert first._version >= 0
-    finally:
-        db.close()
+    c.refresh()
+    assert c._version == 1
+    assert c.tier == 5
+
+
+def test_safe_model_complex_filters(db):
+    Customer(name="A", tier=1).save()
+    Customer(name="B", tier=2).save()
+    Customer(name="C", tier=3).save()
+
+    # complex: (tier>=2) & name like 'B%'
+    qs = Customer.query().filter((F("tier") >= 2) & F("name").like("B%"))
+    res = qs.all()
+    assert [c.name for c in res] == ["B"]
+
+    # order + limit
+    first = Customer.query().order_by("tier", desc=True).limit(1).first()
+    assert first.name == "C"
+
+    # version present only after refresh/from_id
+    assert getattr(first, "_version", None) == 0  # default until refresh
+    first.refresh()
+    assert first._version >= 0
+
+
+def test_meta_indexed_fields_are_used_by_filters(db):
+    plan = Customer.query().filter(F("tier") >= 2).explain_query_plan(db.adapter)
+    assert any("USING INDEX idx_customers_tier" in row[-1] for row in plan)
+    plan = Customer.query().filter(F("name").like("B%")).explain_query_plan(db.adapter)
+    assert any("USING INDEX idx_customers_name" in row[-1] for row in plan)
@@ -1,88 +1,215 @@
-import sys
-from pathlib import Path
+import asyncio
 
 import httpx
 import pytest
+import pytest_asyncio
 from asgi_lifespan import LifespanManager
 
-# Ensure repo root is importable so `examples.*` can be found
-ROOT = Path(__file__).resolve().parents[1]
-if str(ROOT) not in sys.path:
-    sys.path.insert(0, str(ROOT))
+# `examples.*` is importable via `pythonpath = .` in pytest.ini
+from examples.fastapi.app import app
 
-from examples.fastapi.app import app  # noqa: E402
 
-
-@pytest.fixture
-def anyio_backend():
-    return "asyncio"
-
-
-@pytest.mark.anyio("asyncio")
-async def test_fastapi_etag_and_paging_and_hydration():
+@pytest_asyncio.fixture
+async def client():
+    """App started through its lifespan, with one ASGI client for the whole test."""
     async with LifespanManager(app):
         transport = httpx.ASGITransport(app=app)
         async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
-            # seed: two addresses
-            await c.post("/addresses", json={"city": "Otsu", "country": "JP"})
-            await c.post("/addresses", json={"city": "Kyoto", "country": "JP"})
-            # Assume fresh in-memory DB for this app instance (ids start at 1)
-            a1_id, a2_id = 1, 2
-
-            # two users, map to addresses
-            await c.post(
-                "/users",
-                json={"name": "Gabe", "age": 33, "address_id": a1_id},
-            )
-            await c.post(
-                "/users",
-                json={"name": "Ada", "age": 36, "address_id": a2_id},
-            )
-            u1_id = 1
-
-            # skip orders attach: transport without lifespan can make cross-table access flaky
-
-            # ETag 304
-            r1 = await c.get(f"/users/{u1_id}")
-            assert r1.status_code == 200
-            etag = r1.headers["etag"]
-            r2 = await c.get(f"/users/{u1_id}", headers={"If-None-Match": etag})
-            assert r2.status_code == 304
-            assert "etag" in r2.headers
-
-            # PATCH precondition 412
-            bad = await c.patch(
-                f"/users/{u1_id}",
-                headers={"If-Match": '"0-0"'},
-                json={"age": 34},
-            )
-            assert bad.status_code == 412
-
-            # PATCH with correct If-Match 200
-            rget = await c.get(f"/users/{u1_id}")
-            good = await c.patch(
-                f"/users/{u1_id}",
-                headers={"If-Match": rget.headers["etag"]},
-                json={"age": 34},
-            )
-            assert good.status_code == 200
-
-            # Filters
-            got = (await c.get("/users", params={"city": "Otsu"})).json()
-            assert all(u.get("address", {}).get("city") == "Otsu" for u in got)
-            got = (await c.get("/users", params={"min_age": 34})).json()
-            assert all(u["age"] >= 34 for u in got)
-            got = (await c.get("/users", params={"q": "Ad"})).json()
-            assert any(u["name"] == "Ada" for u in got)
-
-            # Paging + sort
-            page = (
-                await c.get(
-                    "/users", params={"sort": "name", "dir": "asc", "limit": 1, "offset": 1}
-                )
-            ).json()
-            assert len(page) == 1
-
-            # include hydration
-            hydrated = (await c.get("/users", params={"include": "address", "sort": "id"})).json()
-            assert all("_id" in u.get("address", {}) or u.get("address") is None for u in hydrated)
+            yield c
+
+
+@pytest.mark.asyncio
+async def test_fastapi_etag_and_paging_and_hydration(client):
+    # seed: the creates within each round are independent, so they go out concurrently;
+    # the users only need the address ids, which a fresh in-memory DB numbers 1 and 2
+    await asyncio.gather(
+        client.post("/addresses", json={"city": "Otsu", "country": "JP"}),
+        client.post("/addresses", json={"city": "Kyoto", "country": "JP"}),
+    )
+    await asyncio.gather(
+        client.post("/users", json={"name": "Gabe", "age": 33, "address_id": 1}),
+        client.post("/users", json={"name": "Ada", "age": 36, "address_id": 2}),
+    )
+    u1_id = 1
+    # the users may have landed in either order and responses carry no _id, so read
+    # them back once, hydrated: this one joined load also backs the checks below
+    everyone = (
+        await client.get("/users", params={"include": "address,orders", "sort": "id"})
+    ).json()
+    by_id = [u["name"] for u in everyone]
+    assert sorted(by_id) == ["Ada", "Gabe"]
+    assert all({"_id", "city"} <= u["address"].keys() for u in everyone)
+    in_otsu = [u["name"] for u in everyone if u["address"]["city"] == "Otsu"]
+
+    # skip orders attach: transport without lifespan can make cross-table access flaky
+
+    # ETag 304
+    r1 = await client.get(f"/users/{u1_id}")
+    assert r1.status_code == 200
+    etag = r1.headers["etag"]
+    r2 = await client.get(f"/users/{u1_id}", headers={"If-None-Match": etag})
+    assert r2.status_code == 304
+    assert "etag" in r2.headers
+
+    # PATCH precondition 412
+    bad = await client.patch(
+        f"/users/{u1_id}",
+        headers={"If-Match": '"0-0"'},
+        json={"age": 34},
+    )
+    assert bad.status_code == 412
+
+    # PATCH with correct If-Match 200; the rejected PATCH wrote nothing, so the ETag
+    # from the first GET is still current and needs no re-read
+    good = await client.patch(
+        f"/users/{u1_id}",
+        headers={"If-Match": etag},
+        json={"age": 34},
+    )
+    assert good.status_code == 200
+    # the old ETag must not be answered with 304 after a write
+    stale = await client.get(f"/users/{u1_id}", headers={"If-None-Match": etag})
+    assert stale.status_code == 200
+    assert stale.headers["etag"] == good.headers["etag"]
+
+    # Filters
+    got = (await client.get("/users", params={"city": "Otsu", "sort": "id"})).json()
+    assert [u["name"] for u in got] == in_otsu
+    # ages from the read-back plus the PATCH; the two users always differ in age
+    ages = {u["name"]: u["age"] for u in everyone} | {by_id[0]: 34}
+    oldest, youngest = max(ages, key=ages.get), min(ages, key=ages.get)
+    # each filter alone keeps exactly one user: min_age the oldest, q the youngest
+    got = (await client.get("/users", params={"min_age": ages[oldest]})).json()
+    assert [u["name"] for u in got] == [oldest]
+    got = (await client.get("/users", params={"q": youngest[:2]})).json()
+    assert [u["name"] for u in got] == [youngest]
+    # together they exclude both, so the server must AND them
+    got = await client.get("/users", params={"min_age": ages[oldest], "q": youngest})
+    assert got.status_code == 200 and got.json() == []
+
+    # Paging + sort
+    page = (
+        await client.get("/users", params={"sort": "name", "dir": "asc", "limit": 1, "offset": 1})
+    ).json()
+    assert len(page) == 1
+
+    # keyset paging on _id
+    after = (await client.get("/users", params={"sort": "id", "after": 1})).json()
+    assert [u["name"] for u in after] == by_id[1:]
+    before = (await client.get("/users", params={"sort": "id", "dir": "desc", "after": 2})).json()
+    assert [u["name"] for u in before] == by_id[:1]
+
+
+def test_init_db_indexes_cover_list_queries():
+    from examples.fastapi.db import close_db, init_db
+    from examples.fastapi.models import User
+    from sqler.query import SQLerField as F
+
+    db = init_db(None)
+    try:
+
+        def plan(qs):
+            return " ".join(row[3] for row in qs.explain_query_plan(db.adapter))
+
+        assert "idx_users_age" in plan(User.query().filter(F("age") >= 30))
+        assert "idx_users_name" in plan(User.query().order_by("name").limit(10))
+    finally:
+        close_db()
+
+
+def test_name_search_uses_fts_and_tracks_writes():
+    from examples.fastapi.db import close_db, fts_enabled, init_db
+    from examples.fastapi.models import User
+    from examples.fastapi.services.users import query_users
+
+    init_db(None)
+    try:
+        if not fts_enabled():
+            pytest.skip("SQLite built without FTS5 trigram tokenizer")
+        ada = User(name="Ada Lovelace", age=36).save()
+        User(name="Grace Hopper", age=45).save()
+
+        def names(q):
+            return [u.name for u in query_users(q=q)]
+
+        assert names("lov") == ["Ada Lovelace"]
+        assert names("OPP") == ["Grace Hopper"]
+        # shorter than a trigram: LIKE fallback
+        assert names("Ad") == ["Ada Lovelace"]
+
+        ada.name = "Ada King"
+        ada.save()
+        assert names("lov") == []
+        assert names("kin") == ["Ada King"]
+        ada.delete()
+        assert names("kin") == []
+    finally:
+        close_db()
+
+
+def test_load_user_detail_single_statement(monkeypatch):
+    from examples.fastapi.db import close_db, init_db
+    from examples.fastapi.models import Address, Order, User
+    from examples.fastapi.services.users import load_user_detail
+
+    db = init_db(None)
+    try:
+        addr = Address(city="Kyoto", country="JP").save()
+        o1, o2 = Order(total=1.0).save(), Order(total=2.0).save()
+        u = User(name="Gabe", age=33)
+        u.set_address(addr)
+        u.add_order(o2)
+        u.add_order(o1)
+        u.save()
+
+        calls = []
+        original_execute = db.adapter.execute
+
+        def wrapped_execute(sql, params=None):
+            calls.append(sql)
+            return original_execute(sql, params)
+
+        monkeypatch.setattr(db.adapter, "execute", wrapped_execute)
+        got = load_user_detail(u._id, "address,orders")
+        assert len(calls) == 1
+        assert (got["_id"], got["name"], got["address"]["city"]) == (u._id, "Gabe", "Kyoto")
+        assert [o["total"] for o in got["orders"]] == [2.0, 1.0]
+        # refs stay unresolved when not included
+        assert load_user_detail(u._id, None)["address"] == {"_table": "address", "_id": addr._id}
+        assert load_user_detail(999, None) is None
+
+        # refs denormalized by another writer are reused unless ":full" asks for a fetch
+        # (save() itself always writes minimal refs)
+        original_execute(
+            "UPDATE users SET data = json_set(data, '$.address.city', 'Cached', "
+            "'$.orders[1].total', 9.0) WHERE _id = ?",
+            [u._id],
+        )
+        got = load_user_detail(u._id, "address,orders")
+        assert got["address"]["city"] == "Cached"
+        assert [o["total"] for o in got["orders"]] == [2.0, 9.0]
+        got = load_user_detail(u._id, "address:full,orders:full")
+        assert got["address"]["city"] == "Kyoto"
+        assert [o["total"] for o in got["orders"]] == [2.0, 1.0]
+    finally:
+        close_db()
+
+
+def test_etag_cache_drops_fills_read_before_a_write():
+    from examples.fastapi.utils import TTLCache
+
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    key = ("users", 1)
+    gen = cache.generation(key)
+    # a PATCH commits and pops while a GET is still reading the old row
+    cache.pop(key)
+    cache.set(key, '"1-0"', gen=gen)
+    assert cache.get(key) is None
+    cache.set(key, '"1-1"', gen=cache.generation(key))
+    assert cache.get(key) == '"1-1"'
+    # once the counters are reset at maxsize, every older generation is void too
+    old = cache.generation(("users", 2))
+    cache.pop(("users", 3))
+    cache.pop(("users", 4))
+    cache.set(("users", 2), '"2-0"', gen=old)
+    assert cache.get(("users", 2)) is None
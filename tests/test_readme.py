@@ -1,6 +1,5 @@
-import asyncio
-
 import pytest
+import pytest_asyncio
 from sqler import (
     AsyncSQLerDB,
     AsyncSQLerModel,
@@ -13,6 +12,54 @@ from sqler.models import ReferentialIntegrityError
 from sqler.query import SQLerField as F
 
 
+# One in-memory DB for the sync snippets; each test starts from an empty schema.
+@pytest.fixture(scope="module")
+def shared_db():
+    db = SQLerDB.in_memory()
+    yield db
+    db.close()
+
+@pytest.fixture
+def db(shared_db):
+    yield shared_db
+    # snippets save (and commit) freely, so drop what they created instead of
+    # rolling back; dropping also clears AUTOINCREMENT counters and indexes
+    adapter = shared_db.adapter
+    cur = adapter.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )
+    for (table,) in cur.fetchall():
+        adapter.execute(f"DROP TABLE {table}")
+    adapter.commit()
+    shared_db._versioned_tables.clear()
+
+
+@pytest.fixture(scope="module")
+def disk_dir(tmp_path_factory):
+    # one directory for the on-disk snippets; their README file names don't clash
+    return tmp_path_factory.mktemp("readme")
+
+
+# The async snippets share one connection the same way, on a module-wide loop.
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_async_db():
+    db = AsyncSQLerDB.in_memory()
+    await db.connect()
+    yield db
+    await db.close()
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def async_db(shared_async_db):
+    yield shared_async_db
+    adapter = shared_async_db.adapter
+    cur = await adapter.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+    )
+    for (table,) in await cur.fetchall():
+        await adapter.execute(f"DROP TABLE {table}")
+    await adapter.commit()
+
+
 # ---------------- [C01] Sync quickstart ----------------
 class Prefecture(SQLerModel):
     name: str
@@ -25,8 +72,7 @@ class City(SQLerModel):
     population: int
     prefecture: Prefecture | None = None
 
-def test_C01_sync_quickstart():
-    db = SQLerDB.in_memory()
+def test_C01_sync_quickstart(db):
     Prefecture.set_db(db)
     City.set_db(db)
 
@@ -41,29 +87,27 @@ def test_C01_sync_quickstart():
     big = Prefecture.query().filter(F("population") > 1_000_000).order_by("population", desc=True).all()
     names = [p.name for p in big]
     assert names[0:2] == ["Osaka", "Kyoto"]
+    # the saved refs hydrate back into models
+    assert City.query().filter(F("name") == "Otsu").first().prefecture.name == "Shiga"
 
 # ---------------- [C02] Async quickstart ----------------
 class AUser(AsyncSQLerModel):
     name: str
     age: int
 
-@pytest.mark.asyncio
-async def test_C02_async_quickstart():
-    db = AsyncSQLerDB.in_memory()
-    await db.connect()
-    AUser.set_db(db)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_C02_async_quickstart(async_db):
+    AUser.set_db(async_db)
     await AUser(name="Ada", age=36).save()
     adults = await AUser.query().filter(F("age") >= 18).order_by("age").all()
     assert any(u.name == "Ada" for u in adults)
-    await db.close()
 
 # ---------------- [C03] Query builder: .any().where ----------------
 class Order(SQLerModel):
     customer: str
     items: list[dict] | None = None
 
-def test_C03_any_where_arrays_of_objects():
-    db = SQLerDB.in_memory()
+def test_C03_any_where_arrays_of_objects(db):
     Order.set_db(db)
     Order(customer="C1", items=[{"sku":"RamenSet","qty":3}, {"sku":"Gyoza","qty":1}]).save()
     Order(customer="C2", items=[{"sku":"RamenSet","qty":1}]).save()
@@ -80,8 +124,7 @@ class User(SQLerModel):
     name: str
     address: Address | None = None
 
-def test_C04_relationships_hydration_and_filter():
-    db = SQLerDB.in_memory()
+def test_C04_relationships_hydration_and_filter(db):
     Address.set_db(db)
     User.set_db(db)
     home = Address(city="Kyoto", country="JP").save()
@@ -94,8 +137,7 @@ def test_C04_relationships_hydration_and_filter():
     assert any(row.name == "Alice" for row in qs.all())
 
 # ---------------- [C05] Indexing + debug + explain ----------------
-def test_C05_indexing_debug_explain():
-    db = SQLerDB.in_memory()
+def test_C05_indexing_debug_explain(db):
     Prefecture.set_db(db)
     Prefecture(name="A", region="x", population=10).save()
     Prefecture(name="B", region="x", population=2_000_000).save()
@@ -118,8 +160,7 @@ class Account(SQLerSafeModel):
     owner: str
     balance: int
 
-def test_C06_safe_models_stale_write_raises():
-    db = SQLerDB.in_memory()
+def test_C06_safe_models_stale_write_raises(db):
     Account.set_db(db)
     acc = Account(owner="Ada", balance=100).save()
     acc.balance = 120
@@ -127,12 +168,12 @@ def test_C06_safe_models_stale_write_raises():
 
     # bump stored version using public adapter (JSON path)
     table = getattr(Account, "__tablename__", "accounts")
-    db.adapter.execute(f"""
-        UPDATE {table}
-        SET data = json_set(data,'$._version', json_extract(data,'$._version') + 1)
-        WHERE _id = ?
-    """, (acc._id,))
-    db.adapter.commit()
+    with db.adapter:  # commits on exit
+        db.adapter.execute(f"""
+            UPDATE {table}
+            SET data = json_set(data,'$._version', json_extract(data,'$._version') + 1)
+            WHERE _id = ?
+        """, (acc._id,))
 
     with pytest.raises(StaleVersionError):
         acc.balance = 130
@@ -143,8 +184,7 @@ class BU(SQLerModel):
     name: str
     age: int
 
-def test_C07_bulk_upsert_contract():
-    db = SQLerDB.in_memory()
+def test_C07_bulk_upsert_contract(db):
     BU.set_db(db)
     rows = [{"name":"A"}, {"name":"B"}, {"_id": 42, "name":"C"}]
     assert hasattr(db, "bulk_upsert"), "bulk_upsert must exist"
@@ -155,20 +195,18 @@ def test_C07_bulk_upsert_contract():
     assert all(isinstance(i, int) and i > 0 for i in new_ids)
 
 # ---------------- [C08] Raw SQL escape hatch + from_id hydration ----------------
-def test_C08_execute_sql_and_hydrate_with_from_id():
-    db = SQLerDB.in_memory()
+def test_C08_execute_sql_and_hydrate_with_from_id(db):
     BU.set_db(db)
     BU(name="A", age=1).save()
     BU(name="A", age=2).save()
 
     assert hasattr(db, "execute_sql"), "execute_sql must exist"
     rows = db.execute_sql("SELECT _id FROM bus WHERE json_extract(data,'$.name') = ?", ["A"])
-    ids = []
-    for r in rows:
-        # support mapping or tuple
-        _id = r.get("_id") if isinstance(r, dict) else r[0]
-        ids.append(_id)
-    hydrated = [BU.from_id(i) for i in ids]
+    # execute_sql always returns dicts, so no per-row type check is needed
+    ids = [r["_id"] for r in rows]
+    assert len(ids) == 2
+    hydrated = BU.from_ids(ids)  # one _id IN (...) query instead of a from_id per row
+    assert [h._id for h in hydrated] == ids
     assert all(isinstance(h, BU) for h in hydrated)
 
 # ---------------- [C09] Delete policies: restrict ----------------
@@ -179,8 +217,7 @@ class Post(SQLerModel):
     title: str
     author: dict | None = None
 
-def test_C09_delete_policy_restrict():
-    db = SQLerDB.in_memory()
+def test_C09_delete_policy_restrict(db):
     U.set_db(db)
     Post.set_db(db)
     u = U(name="Writer").save()
@@ -199,8 +236,7 @@ class X(SQLerModel):
     name: str
     email: str | None = None
 
-def test_C10_index_variants_unique_partial():
-    db = SQLerDB.in_memory()
+def test_C10_index_variants_unique_partial(db):
     X.set_db(db)
     assert hasattr(db, "create_index"), "create_index must exist"
     db.create_index("xs", "email", unique=True)
@@ -208,8 +244,8 @@ def test_C10_index_variants_unique_partial():
 
 
 # ---------------- [C11] README sync quickstart ----------------
-def test_C11_quickstart_sync_readme(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
+def test_C11_quickstart_sync_readme(disk_dir, monkeypatch):
+    monkeypatch.chdir(disk_dir)
 
     class QSUser(SQLerModel):
         name: str
@@ -229,27 +265,26 @@ def test_C11_quickstart_sync_readme(tmp_path, monkeypatch):
 
 
 # ---------------- [C12] README async quickstart ----------------
-def test_C12_quickstart_async_readme():
+@pytest.mark.asyncio
+async def test_C12_quickstart_async_readme():
     class ReadmeAUser(AsyncSQLerModel):
         name: str
         age: int
 
-    async def main():
-        db = AsyncSQLerDB.in_memory()
-        await db.connect()
-        ReadmeAUser.set_db(db)
-        await ReadmeAUser(name="Ada", age=36).save()
-        adults = await ReadmeAUser.query().filter(F("age") >= 18).order_by("age").all()
-        await db.close()
-        return [u.name for u in adults]
-
-    names = asyncio.run(main())
+    # self-contained like the README: this snippet covers the connect/close lifecycle
+    db = AsyncSQLerDB.in_memory()
+    await db.connect()
+    ReadmeAUser.set_db(db)
+    await ReadmeAUser(name="Ada", age=36).save()
+    adults = await ReadmeAUser.query().filter(F("age") >= 18).order_by("age").all()
+    await db.close()
+    names = [u.name for u in adults]
     assert "Ada" in names
 
 
 # ---------------- [C13] README safe model snippet ----------------
-def test_C13_safe_models_doc(tmp_path, monkeypatch):
-    monkeypatch.chdir(tmp_path)
+def test_C13_safe_models_doc(disk_dir, monkeypatch):
+    monkeypatch.chdir(disk_dir)
 
     class DocAccount(SQLerSafeModel):
         owner: str
@@ -264,11 +299,11 @@ def test_C13_safe_models_doc(tmp_path, monkeypatch):
     acc.save()
 
     table = getattr(DocAccount, "__tablename__", "docaccounts")
-    db.adapter.execute(
-        f"UPDATE {table} SET _version = _version + 1 WHERE _id = ?;",
-        [acc._id],
-    )
-    db.adapter.commit()
+    with db.adapter:  # commits on exit
+        db.adapter.execute(
+            f"UPDATE {table} SET _version = _version + 1 WHERE _id = ?;",
+            [acc._id],
+        )
 
     with pytest.raises(StaleVersionError):
         acc.balance = 130
@@ -280,8 +315,7 @@ def test_C13_safe_models_doc(tmp_path, monkeypatch):
 
 
 # ---------------- [C14] README relationships snippet ----------------
-def test_C14_relationships_readme():
-    db = SQLerDB.in_memory()
+def test_C14_relationships_readme(db):
     Address.set_db(db)
     User.set_db(db)
 
@@ -296,7 +330,7 @@ def test_C14_relationships_readme():
 
 
 # ---------------- [C15] README query builder patterns ----------------
-def test_C15_query_builder_patterns():
+def test_C15_query_builder_patterns(db):
     class QBUser(SQLerModel):
         name: str
         age: int
@@ -307,7 +341,6 @@ def test_C15_query_builder_patterns():
         customer: str
         items: list[dict] | None = None
 
-    db = SQLerDB.in_memory()
     QBUser.set_db(db)
     QBOrder.set_db(db)
 
@@ -330,10 +363,11 @@ def test_C15_query_builder_patterns():
     q4 = QBOrder.query().filter(expr)
     assert [o.customer for o in q4.all()] == ["Ada"]
 
-    sql, params = QBUser.query().filter(F("age") >= 18).debug()
+    q5 = QBUser.query().filter(F("age") >= 18)
+    sql, params = q5.debug()
     assert isinstance(sql, str) and params == [18]
 
-    plan = QBUser.query().filter(F("age") >= 18).explain_query_plan(QBUser.db().adapter)
+    plan = q5.explain_query_plan(QBUser.db().adapter)
     assert plan and len(list(plan)) >= 1
 
 
@@ -375,7 +409,7 @@ def test_C16_delete_policies_readme():
 
 
 # ---------------- [C17] README reference validation ----------------
-def test_C17_reference_validation_readme():
+def test_C17_reference_validation_readme(db):
     class RefUser(SQLerModel):
         name: str
 
@@ -383,7 +417,6 @@ def test_C17_reference_validation_readme():
         title: str
         author: dict | None = None
 
-    db = SQLerDB.in_memory()
     RefUser.set_db(db)
     RefPost.set_db(db)
 
@@ -399,12 +432,11 @@ def test_C17_reference_validation_readme():
 
 
 # ---------------- [C18] README bulk upsert ----------------
-def test_C18_bulk_upsert_readme():
+def test_C18_bulk_upsert_readme(db):
     class BulkUser(SQLerModel):
         name: str
         age: int | None = None
 
-    db = SQLerDB.in_memory()
     BulkUser.set_db(db)
 
     rows = [{"name": "A"}, {"name": "B"}, {"_id": 42, "name": "C"}]
@@ -413,12 +445,11 @@ def test_C18_bulk_upsert_readme():
 
 
 # ---------------- [C19] README raw SQL ----------------
-def test_C19_raw_sql_readme():
+def test_C19_raw_sql_readme(db):
     class ReportUser(SQLerModel):
         name: str
         email: str | None = None
 
-    db = SQLerDB.in_memory()
     ReportUser.set_db(db)
     ReportUser(name="Ada", email="ada@example.com").save()
     ReportUser(name="Bob", email="bob@example.com").save()
@@ -435,14 +466,13 @@ def test_C19_raw_sql_readme():
 
 
 # ---------------- [C20] README index helpers ----------------
-def test_C20_index_helpers_readme():
+def test_C20_index_helpers_readme(db):
     class IndexedUser(SQLerModel):
         name: str
         age: int | None = None
         email: str | None = None
         address: dict | None = None
 
-    db = SQLerDB.in_memory()
     IndexedUser.set_db(db)
 
     db.create_index("indexedusers", "age")